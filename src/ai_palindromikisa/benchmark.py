@@ -96,7 +96,7 @@ def run_benchmark_for_config(
 ) -> None:
     """Run benchmark for a single model configuration."""
     separator = "=" * 60
-    options_str = f" (options: {config.options})" if config.options else ""
+    options_str = f" (options: {dict(config.options)})" if config.options else ""
     print(f"\n{separator}")
     print(f"Running benchmark for model: {config.name}{options_str}")
     print(f"Model file: {config.get_base_filename()}.yaml")
@@ -259,7 +259,7 @@ def run_benchmark(
         resolved_configs.append(resolved_config)
 
     config_names = [
-        c.name + (f" {c.options}" if c.options else "") for c in resolved_configs
+        c.name + (f" {dict(c.options)}" if c.options else "") for c in resolved_configs
     ]
     print(f"Running benchmark for models: {', '.join(config_names)}\n")
 
@@ -1,5 +1,7 @@
 """CLI module for ai-palindromikisa using Click."""
 
+import logging
+
 import click
 from click_default_group import DefaultGroup
 
@@ -7,9 +9,10 @@ from click_default_group import DefaultGroup
 def _parse_option_value(value: str) -> str | float | int | bool:
     """Parse an option value string to the appropriate type."""
     # Try boolean
-    if value.lower() in ("true", "on", "yes"):
+    lowered = value.lower()
+    if lowered in ("true", "on", "yes"):
         return True
-    if value.lower() in ("false", "off", "no"):
+    if lowered in ("false", "off", "no"):
         return False
 
     # Try integer
@@ -45,11 +48,21 @@ def option_callback(
     context_settings={"help_option_names": ["-h", "--help"]},
 )
 @click.version_option()
-def cli() -> None:
+@click.option(
+    "-v",
+    "--verbose",
+    is_flag=True,
+    help="Show informational messages, e.g. each model file found",
+)
+def cli(verbose: bool) -> None:
     """AI-Palindromikisa - Benchmark LLMs on Finnish palindrome generation.
 
     Documentation: https://github.com/akaihola/ai-palindromikisa
     """
+    logging.basicConfig(
+        level=logging.INFO if verbose else logging.WARNING,
+        format="%(levelname)s: %(message)s",
+    )
 
 
 @cli.command(name="benchmark")
@@ -105,11 +118,14 @@ def tasks_cmd() -> None:
 
 
 @cli.command(name="export-json")
-def export_json_cmd() -> None:
+@click.option(
+    "--compact", is_flag=True, help="Emit minified JSON instead of indented output"
+)
+def export_json_cmd(compact: bool) -> None:
     """Export statistics as JSON for web visualization."""
     from ai_palindromikisa.export_json import export_json_to_stdout
 
-    export_json_to_stdout()
+    export_json_to_stdout(pretty=not compact)
 
 
 @cli.command(name="serve")
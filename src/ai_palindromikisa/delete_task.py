@@ -1,11 +1,12 @@
 """Delete task runs from benchmark logs based on search term matching."""
 
-from io import StringIO
-
-from ruamel.yaml import YAML
-
 from ai_palindromikisa.paths import BENCHMARK_LOGS_DIR
 from ai_palindromikisa.tasks import load_tasks
+from ai_palindromikisa.yaml_io import (
+    dump_yaml_round_trip,
+    load_yaml,
+    load_yaml_round_trip,
+)
 
 
 def find_matching_tasks(search_term: str) -> list[dict]:
@@ -47,17 +48,11 @@ def delete_task_runs(
     if not BENCHMARK_LOGS_DIR.exists():
         return stats
 
-    yaml_obj = YAML()
-    yaml_obj.preserve_quotes = True
-    yaml_obj.default_flow_style = False
-    yaml_obj.allow_unicode = True
-    yaml_obj.width = 4096
-
     for log_file in sorted(BENCHMARK_LOGS_DIR.glob("*.yaml")):
         stats["files_scanned"] += 1
 
         try:
-            log_data = yaml_obj.load(log_file.read_text(encoding="utf-8"))
+            log_data = load_yaml(log_file)
         except Exception as e:
             print(f"  ERROR reading {log_file.name}: {e}")
             continue
@@ -78,10 +73,14 @@ def delete_task_runs(
             stats["tasks_deleted"] += deleted_count
 
             if not dry_run:
-                log_data["tasks"] = remaining_tasks
-                string_stream = StringIO()
-                yaml_obj.dump(log_data, string_stream)
-                log_file.write_text(string_stream.getvalue(), encoding="utf-8")
+                # Reparse keeping the layout, so only the deleted tasks change
+                yaml_obj, log_data = load_yaml_round_trip(log_file)
+                log_data["tasks"] = [
+                    task
+                    for task in log_data.get("tasks", [])
+                    if task.get("prompt", "") not in matching_prompts
+                ]
+                dump_yaml_round_trip(yaml_obj, log_file, log_data)
 
     return stats
 
@@ -142,22 +142,22 @@ def export_json() -> dict:
     # Build tasks list sorted by success rate
     tasks_list = []
     for prompt, data in tasks_data.items():
-        if data["attempt_count"] == 0:
+        if data.attempt_count == 0:
             continue
-        success_rate = data["success_count"] / data["attempt_count"]
-        avg_time = data["total_time"] / data["attempt_count"]
-        avg_cost = data["total_cost"] / data["attempt_count"]
+        success_rate = data.success_count / data.attempt_count
+        avg_time = data.total_time / data.attempt_count
+        avg_cost = data.total_cost / data.attempt_count
 
         tasks_list.append(
             {
                 "prompt": prompt,
-                "reference": data["reference"],
+                "reference": data.reference,
                 "success_rate": success_rate,
                 "avg_time": avg_time,
                 "avg_cost": avg_cost,
                 "model_results": {
-                    model: result["correct"]
-                    for model, result in data["model_results"].items()
+                    model: result.correct
+                    for model, result in data.model_results.items()
                 },
             }
         )
@@ -226,8 +226,15 @@ def export_json() -> dict:
     }
 
 
-def export_json_to_stdout() -> None:
-    """Export statistics as JSON to stdout."""
+def export_json_to_stdout(pretty: bool = True) -> None:
+    """Export statistics as JSON to stdout.
+
+    Args:
+        pretty: If True, indent the output. If False, emit minified JSON.
+    """
     data = export_json()
-    json.dump(data, sys.stdout, indent=2, ensure_ascii=False)
+    if pretty:
+        json.dump(data, sys.stdout, indent=2, ensure_ascii=False)
+    else:
+        json.dump(data, sys.stdout, separators=(",", ":"), ensure_ascii=False)
     print()  # Add trailing newline
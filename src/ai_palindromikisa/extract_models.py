@@ -9,13 +9,13 @@ from datetime import datetime
 from typing import cast
 
 import plotext as plt
-import yaml
 from rich.console import Console
 from rich.table import Table
 
 from ai_palindromikisa.models import get_display_name_from_path, load_model_config_from_path
 from ai_palindromikisa.paths import BENCHMARK_LOGS_DIR
 from ai_palindromikisa.plots import show_all_plots
+from ai_palindromikisa.yaml_io import load_yaml_files_cached
 
 
 def _extract_model_name(model_path: str) -> str:
@@ -56,15 +56,22 @@ def extract_models_from_logs() -> dict:
     total_cost = 0.0
 
     # Find all YAML files in the benchmark directory
-    yaml_files = list(BENCHMARK_LOGS_DIR.glob("*.yaml"))
+    yaml_files = sorted(BENCHMARK_LOGS_DIR.glob("*.yaml"))
 
     if not yaml_files:
         print(f"No YAML files found in '{BENCHMARK_LOGS_DIR}'.")
         return {"models": {}, "total_cost": 0.0, "log_count": 0}
 
-    for yaml_file in sorted(yaml_files):
+    # Parsed with the C loader, concurrently and only when changed since the
+    # last parse in this process; results keep the sorted order
+    parsed = load_yaml_files_cached(yaml_files)
+
+    for yaml_file, parsed_data in zip(yaml_files, parsed):
+        if isinstance(parsed_data, Exception):
+            print(f"Error processing {yaml_file.name}: {parsed_data}")
+            continue
         try:
-            data = cast("dict", yaml.safe_load(yaml_file.read_text(encoding="utf-8")))
+            data = cast("dict", parsed_data)
             tasks = data.get("tasks", [])
 
             model_path = data.get("model", "Unknown")
@@ -1,5 +1,11 @@
 """Formatting utilities for prices and other display values."""
 
+# Labels appended to console prices for the known price sources
+_SOURCE_LABELS = {
+    "openrouter": " (openrouter - actual)",
+    "litellm": " (litellm)",
+}
+
 
 def format_price_for_log(price: float | None) -> str | None:
     """
@@ -57,9 +63,5 @@ def format_price_for_console(price: float | None, source: str) -> str:
     elif "." not in price_str:
         price_str += ".0"
 
-    if source == "openrouter":
-        return f"{price_str} (openrouter - actual)"
-    elif source == "litellm":
-        return f"{price_str} (litellm)"
-    else:
-        return f"{price_str} (source: {source})"
+    label = _SOURCE_LABELS.get(source) or f" (source: {source})"
+    return f"{price_str}{label}"
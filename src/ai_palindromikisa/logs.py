@@ -1,15 +1,24 @@
+import os
 from datetime import datetime
-from io import StringIO
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ruamel.yaml import YAML
-
 from ai_palindromikisa.paths import BENCHMARK_LOGS_DIR
+from ai_palindromikisa.yaml_io import (
+    dump_log_yaml,
+    file_signature,
+    load_yaml_cached,
+    remember_yaml,
+    write_bytes_atomic,
+)
 
 if TYPE_CHECKING:
     from ai_palindromikisa.models import ModelConfig
 
+# Signatures of the logs last written by this process, i.e. of files holding
+# exactly dump_log_yaml() of their cached document
+_dumped_logs: dict[Path, tuple[int, int]] = {}
+
 
 def get_existing_logs(config: "ModelConfig", system_prompt: str) -> list:
     """Read all existing log files for the model configuration.
@@ -23,18 +32,27 @@ def get_existing_logs(config: "ModelConfig", system_prompt: str) -> list:
     expected_model_path = f"models/{config.get_base_filename()}.yaml"
     # Also match by filename pattern (for backward compatibility and direct matching)
     expected_log_suffix = f"-{config.get_base_filename()}.yaml"
+    # Logs match when their template starts with the prompt, so strip it only once
+    prompt_prefix = system_prompt.strip()
 
     existing_logs = []
-    for log_file in BENCHMARK_LOGS_DIR.glob("*.yaml"):
+    with os.scandir(BENCHMARK_LOGS_DIR) as it:
+        entries = [
+            entry
+            for entry in it
+            if entry.name.endswith(".yaml") and not entry.name.startswith(".")
+        ]
+    for entry in entries:
+        log_file = Path(entry.path)
         try:
-            yaml_obj = YAML()
-            log_data = yaml_obj.load(log_file.read_text(encoding="utf-8"))
+            # The directory read already provides the stat used as cache key
+            log_data = load_yaml_cached(log_file, entry.stat())
 
             # Check if system prompt matches
-            if not (
-                log_data.get("prompt_template", "")
-                .strip()
-                .startswith(system_prompt.strip())
+            if (
+                not log_data.get("prompt_template", "")
+                .lstrip()
+                .startswith(prompt_prefix)
             ):
                 continue
 
@@ -56,53 +74,22 @@ def get_existing_logs(config: "ModelConfig", system_prompt: str) -> list:
 
 
 def load_existing_log(log_path: Path):
-    """Load existing log file or return empty structure if file doesn't exist."""
-    if not log_path.exists():
-        return None
+    """Load existing log file or return empty structure if file doesn't exist.
 
-    yaml_obj = YAML()
-    return yaml_obj.load(log_path.read_text(encoding="utf-8"))
+    Files already parsed or written in this process are not parsed again.
+    The returned document is shared and must not be mutated.
+    """
+    try:
+        return load_yaml_cached(log_path)
+    except FileNotFoundError:
+        return None
 
 
 def save_log(log_path, log_data):
     """Save log data to file with proper formatting."""
-    # Write to file with proper formatting for multi-line strings
-    yaml_obj = YAML()
-    yaml_obj.preserve_quotes = True
-    yaml_obj.default_flow_style = False
-    yaml_obj.allow_unicode = True
-    yaml_obj.width = 4096  # Prevent line wrapping
-    yaml_obj.indent(mapping=2, sequence=4, offset=2)
-
-    # Configure ruamel.yaml to use literal block scalars for multi-line strings
-    def represent_str(self, data):
-        if "\n" in data and len(data.split("\n")) > 1:
-            return self.represent_scalar("tag:yaml.org,2002:str", data, style="|")
-        return self.represent_scalar("tag:yaml.org,2002:str", data)
-
-    yaml_obj.representer.add_representer(str, represent_str)
-
-    # Custom representer for floats to avoid scientific notation
-    def represent_float(representer, value):
-        if value != value:  # NaN
-            return representer.represent_scalar("tag:yaml.org,2002:float", ".nan")
-        elif value == float("inf"):
-            return representer.represent_scalar("tag:yaml.org,2002:float", ".inf")
-        elif value == float("-inf"):
-            return representer.represent_scalar("tag:yaml.org,2002:float", "-.inf")
-        else:
-            # Format to avoid scientific notation, up to 10 decimal places
-            formatted = f"{value:.10f}".rstrip("0").rstrip(".")
-            if "." not in formatted:
-                formatted += ".0"
-            return representer.represent_scalar("tag:yaml.org,2002:float", formatted)
-
-    yaml_obj.representer.add_representer(float, represent_float)
-
-    # Convert to string and write using Path
-    string_stream = StringIO()
-    yaml_obj.dump(log_data, string_stream)
-    log_path.write_text(string_stream.getvalue(), encoding="utf-8")
+    # Multi-line strings become literal blocks and floats avoid scientific notation.
+    # Writing atomically means an interrupted write never leaves a truncated log.
+    write_bytes_atomic(log_path, dump_log_yaml(log_data).encode("utf-8"))
 
 
 def get_log_path(config: "ModelConfig") -> Path:
@@ -110,24 +97,25 @@ def get_log_path(config: "ModelConfig") -> Path:
     # Generate filename with date and model config base filename
     date_str = datetime.now().strftime("%Y-%m-%d")
     log_filename = f"{date_str}-{config.get_base_filename()}.yaml"
-
-    # Create benchmark_logs directory if it doesn't exist
-    BENCHMARK_LOGS_DIR.mkdir(parents=True, exist_ok=True)
-
     return BENCHMARK_LOGS_DIR / log_filename
 
 
-def save_task_result(
-    config: "ModelConfig",
-    system_prompt: str,
-    prompt: str,
-    response_text: str,
-    is_correct: bool,
-    duration: float,
-    timestamp: str,
-    metadata: dict,
+def append_task_results(
+    config: "ModelConfig", system_prompt: str, results: list[dict]
 ) -> Path:
-    """Save a single task result to the log file."""
+    """Append task results to today's log file with a single write.
+
+    Logs last written by this process get the new entries appended to the end
+    of the file; any other log is parsed and rewritten in full.
+
+    Args:
+        config: Model configuration the results belong to
+        system_prompt: Prompt template used for the tasks
+        results: Task entries as stored under the log's ``tasks`` key
+
+    Returns:
+        Path to the log file
+    """
     log_path = get_log_path(config)
 
     # Generate model path reference
@@ -141,20 +129,53 @@ def save_task_result(
         "tasks": [],
     }
 
-    # Append the new task result
-    existing_data["tasks"].append(
-        {
-            "timestamp": timestamp,
-            "prompt": prompt,
-            "answer": response_text,
-            "is_correct": is_correct,
-            "duration_seconds": round(duration, 2),
-            "metadata": metadata,
-        }
-    )
+    # Copy instead of extending in place: the loaded document may be shared with
+    # the results of an earlier get_existing_logs() call
+    updated_data = {**existing_data, "tasks": [*existing_data["tasks"], *results]}
+
+    if (
+        existing_data["tasks"]
+        and next(reversed(existing_data)) == "tasks"
+        and _dumped_logs.get(log_path) == file_signature(log_path.stat())
+    ):
+        # The file ends with the task list in our own layout, so the new entries
+        # serialize to text that can simply be appended instead of a full rewrite
+        fragment = dump_log_yaml({"tasks": results}).partition("\n")[2]
+        with log_path.open("ab") as fp:
+            fp.write(fragment.encode("utf-8"))
+    else:
+        save_log(log_path, updated_data)
+
+    # Remember the written document, so the next append skips parsing
+    _dumped_logs[log_path] = remember_yaml(log_path, updated_data)
+    return log_path
 
-    # Save the updated log
-    save_log(log_path, existing_data)
+
+def save_task_result(
+    config: "ModelConfig",
+    system_prompt: str,
+    prompt: str,
+    response_text: str,
+    is_correct: bool,
+    duration: float,
+    timestamp: str,
+    metadata: dict,
+) -> Path:
+    """Save a single task result to the log file."""
+    log_path = append_task_results(
+        config,
+        system_prompt,
+        [
+            {
+                "timestamp": timestamp,
+                "prompt": prompt,
+                "answer": response_text,
+                "is_correct": is_correct,
+                "duration_seconds": round(duration, 2),
+                "metadata": metadata,
+            }
+        ],
+    )
     print(f"Task result saved to: {log_path}")
     return log_path
 
@@ -1,12 +1,15 @@
 """Migration script for renaming model and log files to new option-based naming."""
 
-from io import StringIO
 from pathlib import Path
 
-from ruamel.yaml import YAML
-
+from ai_palindromikisa.models import options_match
 from ai_palindromikisa.option_suffix import generate_option_suffix
 from ai_palindromikisa.paths import BENCHMARK_LOGS_DIR, MODELS_DIR
+from ai_palindromikisa.yaml_io import (
+    dump_yaml_round_trip,
+    load_yaml,
+    load_yaml_round_trip,
+)
 
 
 def migrate_files(dry_run: bool = False) -> None:
@@ -51,11 +54,8 @@ def _process_model_file(model_file: Path, dry_run: bool) -> tuple[str, str] | No
     Returns:
         Tuple of (old_model_ref, new_model_ref) if renamed, None otherwise
     """
-    yaml_obj = YAML()
-    yaml_obj.preserve_quotes = True
-
     try:
-        model_data = yaml_obj.load(model_file.read_text(encoding="utf-8"))
+        model_data = load_yaml(model_file)
     except Exception as e:
         print(f"  ERROR reading {model_file.name}: {e}")
         return None
@@ -83,7 +83,7 @@ def _process_model_file(model_file: Path, dry_run: bool) -> tuple[str, str] | No
     if new_file_path.exists() and new_file_path != model_file:
         # Target exists - validate content matches
         try:
-            existing_data = yaml_obj.load(new_file_path.read_text(encoding="utf-8"))
+            existing_data = load_yaml(new_file_path)
             if not _model_data_matches(model_data, existing_data):
                 print(
                     f"  ERROR {model_file.name} -> {new_filename}: "
@@ -114,36 +114,15 @@ def _model_data_matches(data1: dict, data2: dict) -> bool:
     if data1.get("name") != data2.get("name"):
         return False
 
-    # Compare options
-    opts1 = data1.get("options", {}) or {}
-    opts2 = data2.get("options", {}) or {}
-
-    if set(opts1.keys()) != set(opts2.keys()):
-        return False
-
-    for key in opts1:
-        v1, v2 = opts1[key], opts2[key]
-        if isinstance(v1, (int, float)) and isinstance(v2, (int, float)):
-            if float(v1) != float(v2):
-                return False
-        elif v1 != v2:
-            return False
-
-    return True
+    return options_match(data1.get("options"), data2.get("options"))
 
 
 def _process_log_file(
     log_file: Path, model_renames: dict[str, str], dry_run: bool
 ) -> None:
     """Process a single log file - update model reference and rename if needed."""
-    yaml_obj = YAML()
-    yaml_obj.preserve_quotes = True
-    yaml_obj.default_flow_style = False
-    yaml_obj.allow_unicode = True
-    yaml_obj.width = 4096
-
     try:
-        log_data = yaml_obj.load(log_file.read_text(encoding="utf-8"))
+        yaml_obj, log_data = load_yaml_round_trip(log_file)
     except Exception as e:
         print(f"  ERROR reading {log_file.name}: {e}")
         return
@@ -181,11 +160,7 @@ def _process_log_file(
                 if not dry_run:
                     if content_changed:
                         # Write updated content to new location
-                        string_stream = StringIO()
-                        yaml_obj.dump(log_data, string_stream)
-                        new_log_path.write_text(
-                            string_stream.getvalue(), encoding="utf-8"
-                        )
+                        dump_yaml_round_trip(yaml_obj, new_log_path, log_data)
                         log_file.unlink()
                     else:
                         log_file.rename(new_log_path)
@@ -193,8 +168,4 @@ def _process_log_file(
 
     # If only content changed but filename stays the same
     if content_changed and not dry_run:
-        string_stream = StringIO()
-        yaml_obj.dump(log_data, string_stream)
-        log_file.write_text(string_stream.getvalue(), encoding="utf-8")
-
-
+        dump_yaml_round_trip(yaml_obj, log_file, log_data)
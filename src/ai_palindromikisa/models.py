@@ -1,21 +1,45 @@
+import logging
+import os
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from io import StringIO
+from functools import cached_property
 from pathlib import Path
+from types import MappingProxyType
 
-from ruamel.yaml import YAML
+import yaml
 
 from ai_palindromikisa.option_suffix import generate_option_suffix
 from ai_palindromikisa.paths import MODELS_DIR
+from ai_palindromikisa.yaml_io import (
+    forget_yaml,
+    load_yaml_cached,
+    load_yaml_files_cached,
+    remember_yaml,
+    write_bytes_atomic,
+)
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Parsed model configurations keyed by a stat signature of the models directory
+_CONFIGS_CACHE: dict[tuple, list["ModelConfig"]] = {}
+
+
+@dataclass(frozen=True)
 class ModelConfig:
-    """Configuration for a model including name and options."""
+    """Configuration for a model including name and options.
+
+    Instances are immutable, so derived names are computed once and cached.
+    Options are copied into a read-only mapping so they cannot drift from the
+    cached names.
+    """
 
     name: str
-    options: dict[str, str | float | int | bool] = field(default_factory=dict)
+    options: Mapping[str, str | float | int | bool] = field(default_factory=dict)
     skip: bool = False
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "options", MappingProxyType(dict(self.options)))
+
     def get_display_name(self) -> str:
         """Get the display name in llm library format with verbose options.
 
@@ -26,6 +50,10 @@ class ModelConfig:
             ModelConfig("gpt-4o-mini", {"temperature": 0.3, "top_p": 0.9})
                 -> "gpt-4o-mini: temperature 0.3, top_p 0.9"
         """
+        return self._display_name
+
+    @cached_property
+    def _display_name(self) -> str:
         if not self.options:
             return self.name
         options_str = ", ".join(f"{k} {v}" for k, v in sorted(self.options.items()))
@@ -39,6 +67,10 @@ class ModelConfig:
             ModelConfig("openrouter/x-ai/grok-4", {"temperature": 0.3})
                 -> "openrouter-x-ai-grok-4-t03"
         """
+        return self._base_filename
+
+    @cached_property
+    def _base_filename(self) -> str:
         model_filename = self.name.replace("/", "-")
         suffix = generate_option_suffix(self.options)
         return f"{model_filename}{suffix}"
@@ -48,6 +80,31 @@ class ModelConfig:
         return MODELS_DIR / f"{self.get_base_filename()}.yaml"
 
 
+def invalidate_cache() -> None:
+    """Forget cached model configurations so the next lookup rereads the files."""
+    _CONFIGS_CACHE.clear()
+    forget_yaml(MODELS_DIR)
+
+
+def _scan_model_files() -> list[os.DirEntry[str]]:
+    """List the model files with a single directory read, sorted by name."""
+    with os.scandir(MODELS_DIR) as it:
+        return sorted(
+            (entry for entry in it if entry.name.endswith(".yaml") and entry.is_file()),
+            key=lambda entry: entry.name,
+        )
+
+
+def _models_dir_signature(entries: list[os.DirEntry[str]]) -> tuple:
+    """Build a cache key from the mtimes and sizes of the model files."""
+    # DirEntry caches its stat result, so each file is stat'ed at most once
+    files = tuple(
+        (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+        for entry in entries
+    )
+    return (str(MODELS_DIR), MODELS_DIR.stat().st_mtime_ns, files)
+
+
 def get_all_model_configs(include_skipped: bool = False) -> list[ModelConfig]:
     """Extract model configurations from model files in the models directory.
 
@@ -59,31 +116,47 @@ def get_all_model_configs(include_skipped: bool = False) -> list[ModelConfig]:
         List of ModelConfig objects.
     """
     if not MODELS_DIR.exists():
-        print(f"Warning: Models directory '{MODELS_DIR}' not found.")
-        print("Please create the models directory and add model configuration files.")
+        logger.warning(
+            "Models directory '%s' not found. "
+            "Please create the models directory and add model configuration files.",
+            MODELS_DIR,
+        )
         return []
 
+    entries = _scan_model_files()
+    cache_key = (_models_dir_signature(entries), include_skipped)
+    if cache_key in _CONFIGS_CACHE:
+        return list(_CONFIGS_CACHE[cache_key])
+
     configs = []
     model_files_found = 0
 
-    for model_file in sorted(MODELS_DIR.glob("*.yaml")):
-        if model_file.name == "README.md":
-            continue
+    model_files = [Path(entry.path) for entry in entries]
+    # Only new or changed files are parsed
+    parsed = load_yaml_files_cached(model_files, [entry.stat() for entry in entries])
+
+    for model_file, model_data in zip(model_files, parsed):
         model_files_found += 1
+        if isinstance(model_data, Exception):
+            logger.warning(
+                "Could not read model file %s: %s", model_file.name, model_data
+            )
+            continue
         try:
-            yaml_obj = YAML()
-            model_data = yaml_obj.load(model_file.read_text(encoding="utf-8"))
             # Extract the model name from the name field
             model_name = model_data.get("name", "")
             if model_name:
                 options = model_data.get("options", {}) or {}
                 skip = model_data.get("skip", False)
+                options_str = f" (options: {options})" if options else ""
 
                 # Skip models with skip=true unless include_skipped is True
                 if skip and not include_skipped:
-                    options_str = f" (options: {options})" if options else ""
-                    print(
-                        f"Skipping model: {model_name}{options_str} (from {model_file.name})"
+                    logger.info(
+                        "Skipping model: %s%s (from %s)",
+                        model_name,
+                        options_str,
+                        model_file.name,
                     )
                     continue
 
@@ -93,28 +166,32 @@ def get_all_model_configs(include_skipped: bool = False) -> list[ModelConfig]:
                     skip=skip,
                 )
                 configs.append(config)
-                options_str = f" (options: {options})" if options else ""
-                skip_str = " [SKIPPED]" if skip else ""
-                print(
-                    f"Found model: {model_name}{options_str}{skip_str} (from {model_file.name})"
+                logger.info(
+                    "Found model: %s%s%s (from %s)",
+                    model_name,
+                    options_str,
+                    " [SKIPPED]" if skip else "",
+                    model_file.name,
                 )
             else:
-                print(f"Warning: No 'name' field found in {model_file.name}")
+                logger.warning("No 'name' field found in %s", model_file.name)
         except Exception as e:
-            print(f"Warning: Could not read model file {model_file.name}: {e}")
+            logger.warning("Could not read model file %s: %s", model_file.name, e)
 
     if model_files_found == 0:
-        print("No model configuration files found in models directory.")
+        logger.warning("No model configuration files found in models directory.")
     elif len(configs) == 0:
-        print(
-            f"Found {model_files_found} model files but none had valid 'name' fields."
+        logger.warning(
+            "Found %d model files but none had valid 'name' fields.",
+            model_files_found,
         )
 
+    _CONFIGS_CACHE[cache_key] = list(configs)
     return configs
 
 
 def find_or_create_model_config(
-    model_name: str, options: dict[str, str | float | int | bool]
+    model_name: str, options: Mapping[str, str | float | int | bool]
 ) -> ModelConfig:
     """Find an existing model config matching name and options, or create a new one.
 
@@ -131,73 +208,78 @@ def find_or_create_model_config(
     config = ModelConfig(name=model_name, options=options)
     model_file_path = config.get_model_file_path()
 
-    if model_file_path.exists():
-        # Validate that existing file has matching options
-        yaml_obj = YAML()
-        model_data = yaml_obj.load(model_file_path.read_text(encoding="utf-8"))
-        file_options = model_data.get("options", {}) or {}
-
-        if not _options_match(options, file_options):
-            raise ValueError(
-                f"Model file {model_file_path} exists but has different options. "
-                f"Expected: {options}, Found: {file_options}"
-            )
-
+    # The filename is derived from name and options, so only one candidate exists.
+    # A file parsed or written earlier in this process (e.g. by
+    # get_all_model_configs) is only parsed again if it has changed since.
+    try:
+        model_data = load_yaml_cached(model_file_path)
+    except FileNotFoundError:
+        # File doesn't exist, create it
+        _create_model_file(config)
         return config
 
-    # File doesn't exist, create it
-    _create_model_file(config)
+    # Validate that existing file has matching options
+    file_options = model_data.get("options", {}) or {}
+
+    if not options_match(options, file_options):
+        raise ValueError(
+            f"Model file {model_file_path} exists but has different options. "
+            f"Expected: {dict(options)}, Found: {file_options}"
+        )
+
     return config
 
 
-def _options_match(
-    opts1: dict[str, str | float | int | bool],
-    opts2: dict[str, str | float | int | bool],
-) -> bool:
-    """Check if two option dictionaries match."""
-    # Normalize both to handle empty dict vs None and type differences
-    opts1 = opts1 or {}
-    opts2 = opts2 or {}
+def _canon_options(
+    opts: dict[str, str | float | int | bool] | None,
+) -> tuple[tuple[str, str | float | int | bool], ...]:
+    """Build a hashable canonical form of an options dict.
 
-    if set(opts1.keys()) != set(opts2.keys()):
-        return False
+    Numbers are compared as floats so that e.g. ``5`` and ``5.0`` are equal.
+    """
+    return tuple(
+        sorted(
+            (key, float(value) if isinstance(value, (int, float)) else value)
+            for key, value in (opts or {}).items()
+        )
+    )
 
-    for key in opts1:
-        # Compare values, handling numeric type differences
-        v1, v2 = opts1[key], opts2[key]
-        if isinstance(v1, (int, float)) and isinstance(v2, (int, float)):
-            if float(v1) != float(v2):
-                return False
-        elif v1 != v2:
-            return False
 
-    return True
+def options_match(
+    opts1: Mapping[str, str | float | int | bool] | None,
+    opts2: Mapping[str, str | float | int | bool] | None,
+) -> bool:
+    """Check if two option dictionaries match."""
+    return _canon_options(opts1) == _canon_options(opts2)
 
 
 def _create_model_file(config: ModelConfig) -> Path:
     """Create a model metadata file for the given configuration."""
     model_file_path = config.get_model_file_path()
 
-    # Ensure models directory exists
-    model_file_path.parent.mkdir(parents=True, exist_ok=True)
-
     # Create the model metadata
     model_metadata: dict = {"name": config.name}
     if config.options:
         model_metadata["options"] = dict(config.options)
 
-    # Write the metadata file
-    yaml_obj = YAML()
-    yaml_obj.preserve_quotes = True
-    yaml_obj.default_flow_style = False
-    yaml_obj.allow_unicode = True
+    # PyYAML writes floats such as 1e-05 as 1.0e-05, which it reads back as
+    # floats; JSON's 1e-05 would load as a string
+    payload = yaml.safe_dump(
+        model_metadata, allow_unicode=True, sort_keys=False
+    ).encode("utf-8")
+
+    # Leave an identical existing file untouched
+    try:
+        if model_file_path.read_bytes() == payload:
+            return model_file_path
+    except FileNotFoundError:
+        pass
 
-    # Convert to string and write using Path
-    string_stream = StringIO()
-    yaml_obj.dump(model_metadata, string_stream)
-    model_file_path.write_text(string_stream.getvalue(), encoding="utf-8")
+    write_bytes_atomic(model_file_path, payload)
+    # The written document is known, so listing the directory needn't reparse it
+    remember_yaml(model_file_path, model_metadata)
 
-    print(f"Created model metadata file: {model_file_path}")
+    logger.info("Created model metadata file: %s", model_file_path)
     return model_file_path
 
 
@@ -235,12 +317,9 @@ def load_model_config_from_path(model_path: str) -> ModelConfig | None:
     else:
         model_file = Path(model_path)
 
-    if not model_file.exists():
-        return None
-
+    # A missing file surfaces as FileNotFoundError below; no separate exists() stat
     try:
-        yaml_obj = YAML()
-        model_data = yaml_obj.load(model_file.read_text(encoding="utf-8"))
+        model_data = load_yaml_cached(model_file)
         model_name = model_data.get("name", "")
         if not model_name:
             return None
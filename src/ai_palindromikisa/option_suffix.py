@@ -1,7 +1,14 @@
 """Option suffix generation for model and log filenames."""
 
+import functools
 import re
 
+# Separators between option name parts, e.g. the underscore in "top_p"
+_NON_ALPHA_RE = re.compile(r"[^a-zA-Z]+")
+
+# Floats below this format identically from repr() and with 10 fixed decimals
+_REPR_EXACT_BELOW = 2.0**19
+
 
 def generate_option_suffix(options: dict[str, str | float | int | bool]) -> str:
     """Generate filename suffix from options dict.
@@ -18,13 +25,30 @@ def generate_option_suffix(options: dict[str, str | float | int | bool]) -> str:
     if not options:
         return ""
 
-    option_names = sorted(options.keys())
+    # The value type is part of the key since True == 1 == 1.0 but they format
+    # differently
+    return _suffix_cached(
+        tuple(sorted((name, type(value), value) for name, value in options.items()))
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _suffix_cached(
+    items: tuple[tuple[str, type, str | float | int | bool], ...],
+) -> str:
+    """Build the suffix for sorted (name, type, value) triples, memoized."""
+    if len(items) == 1:
+        # A lone option can't collide, so skip the collision resolution machinery
+        name, _, value = items[0]
+        return f"-{_initial_abbreviation(name)}{_format_option_value(value)}"
+
+    option_names = [name for name, _, _ in items]
     abbreviations = _generate_abbreviations(option_names)
 
     parts = []
-    for name in option_names:
+    for name, _, value in items:
         abbrev = abbreviations[name]
-        value_str = _format_option_value(options[name])
+        value_str = _format_option_value(value)
         parts.append(f"{abbrev}{value_str}")
 
     return "-" + "-".join(parts)
@@ -53,22 +77,10 @@ def _generate_abbreviations(option_names: list[str]) -> dict[str, str]:
     sorted_names = sorted(option_names)
 
     # Split each name into parts at non-alpha characters
-    name_parts: dict[str, list[str]] = {}
-    for name in sorted_names:
-        parts = re.split(r"[^a-zA-Z]+", name)
-        # Filter out empty strings
-        name_parts[name] = [p for p in parts if p]
+    name_parts = {name: _split_name(name) for name in sorted_names}
 
     # Generate initial abbreviations (first char of each part)
-    abbreviations: dict[str, str] = {}
-    for name in sorted_names:
-        parts = name_parts[name]
-        if parts:
-            abbrev = "".join(p[0] for p in parts)
-        else:
-            # Fallback for names with no alpha chars (unlikely but handle it)
-            abbrev = name[0] if name else ""
-        abbreviations[name] = abbrev
+    abbreviations = {name: _initial_abbreviation(name) for name in sorted_names}
 
     # Resolve collisions - alphabetically first keeps abbrev, later ones expand
     _resolve_collisions(sorted_names, abbreviations, name_parts)
@@ -76,6 +88,20 @@ def _generate_abbreviations(option_names: list[str]) -> dict[str, str]:
     return abbreviations
 
 
+def _split_name(name: str) -> list[str]:
+    """Split an option name into its non-empty alphabetic parts."""
+    return [p for p in _NON_ALPHA_RE.split(name) if p]
+
+
+def _initial_abbreviation(name: str) -> str:
+    """Abbreviate an option name to the first character of each part."""
+    parts = _split_name(name)
+    if parts:
+        return "".join(p[0] for p in parts)
+    # Fallback for names with no alpha chars (unlikely but handle it)
+    return name[0] if name else ""
+
+
 def _resolve_collisions(
     sorted_names: list[str],
     abbreviations: dict[str, str],
@@ -86,6 +112,11 @@ def _resolve_collisions(
     For collisions, the alphabetically first name keeps the abbreviation,
     later names get progressively longer abbreviations.
     """
+    # Common case: every abbreviation is already unique
+    used_abbrevs = set(abbreviations.values())
+    if len(used_abbrevs) == len(abbreviations):
+        return
+
     # Group names by their current abbreviation
     abbrev_to_names: dict[str, list[str]] = {}
     for name in sorted_names:
@@ -100,12 +131,14 @@ def _resolve_collisions(
             continue
 
         # First name (alphabetically) keeps the abbreviation
-        # Others need to be expanded
+        # Others need to be expanded. The replaced abbreviation stays in use by
+        # the first name, so the set of used ones only ever grows
         for name in names[1:]:
             new_abbrev = _expand_abbreviation(
-                name, name_parts[name], abbrev, set(abbreviations.values())
+                name, name_parts[name], abbrev, used_abbrevs
             )
             abbreviations[name] = new_abbrev
+            used_abbrevs.add(new_abbrev)
 
 
 def _expand_abbreviation(
@@ -179,8 +212,18 @@ def _format_option_value(value: str | float | int | bool) -> str:
         else:
             sign = ""
 
-        # Format with enough precision to capture the value
-        formatted = f"{value:.10f}".rstrip("0").rstrip(".")
+        # The shortest round-trip repr is usually already what we want. Below
+        # 2**19 a float is within half of 1e-10 of its repr, so a repr with at
+        # most 10 decimals equals the fixed 10-decimal formatting used for
+        # existing filenames. Anything else falls back to that formatting.
+        formatted = repr(value)
+        if (
+            value >= _REPR_EXACT_BELOW
+            or "e" in formatted
+            or len(formatted.partition(".")[2]) > 10
+        ):
+            formatted = f"{value:.10f}"
+        formatted = formatted.rstrip("0").rstrip(".")
 
         # Remove the decimal point
         if "." in formatted:
@@ -2,8 +2,9 @@
 
 from pathlib import Path
 
-# Package directory (src/ai_palindromikisa/)
-PACKAGE_DIR = Path(__file__).parent
+# Package directory (src/ai_palindromikisa/), resolved once so symlinks
+# aren't re-walked by every later filesystem call
+PACKAGE_DIR = Path(__file__).resolve().parent
 
 # Project root directory (contains src/, models/, benchmark_logs/, etc.)
 PROJECT_ROOT = PACKAGE_DIR.parent.parent
@@ -1,6 +1,7 @@
 """Console scatterplots for model statistics using plotext."""
 
 import os
+import re
 import string
 
 import plotext as plt
@@ -64,6 +65,43 @@ MODEL_MARKERS: dict[str, str] = {
     "glm-4": "z",
 }
 
+# Pattern lookups iterate these snapshots instead of building dict views per call
+_MARKER_ITEMS = tuple(MODEL_MARKERS.items())
+_COLOR_ITEMS = tuple(MODEL_COLOR_PATTERNS.items())
+
+
+def _compile_alternation(items: tuple[tuple[str, object], ...]) -> re.Pattern[str]:
+    """Compile a regex matching any of the patterns in a single scan."""
+    return re.compile("|".join(re.escape(pattern) for pattern, _ in items))
+
+
+_MARKER_RE = _compile_alternation(_MARKER_ITEMS)
+_COLOR_RE = _compile_alternation(_COLOR_ITEMS)
+_MARKER_INDEX = {pattern: i for i, (pattern, _) in enumerate(_MARKER_ITEMS)}
+_COLOR_INDEX = {pattern: i for i, (pattern, _) in enumerate(_COLOR_ITEMS)}
+
+
+def _first_pattern_index(
+    regex: re.Pattern[str],
+    index: dict[str, int],
+    items: tuple[tuple[str, object], ...],
+    name_lower: str,
+) -> int | None:
+    """Find the index of the first pattern in items that occurs in name_lower.
+
+    One regex scan rules out names without any pattern. A match may not be the
+    pattern listed first, so only the patterns listed before it are rechecked.
+    """
+    match = regex.search(name_lower)
+    if match is None:
+        return None
+    found = index[match.group()]
+    for i in range(found):
+        if items[i][0] in name_lower:
+            return i
+    return found
+
+
 # Fallback markers for unknown models (excluding reserved ones)
 RESERVED_MARKERS = set(MODEL_MARKERS.values())
 FALLBACK_MARKERS = [
@@ -75,23 +113,29 @@ FALLBACK_MARKERS = [
 ]
 
 
-def _get_marker_for_model(model_name: str) -> str | None:
-    """Get predefined marker for a model name, or None if not found."""
-    name_lower = model_name.lower()
-    for pattern, marker in MODEL_MARKERS.items():
-        if pattern in name_lower:
-            return marker
-    return None
+def _get_marker_for_model(name_lower: str) -> str | None:
+    """Get predefined marker for a lowercased model name, or None if not found."""
+    i = _first_pattern_index(_MARKER_RE, _MARKER_INDEX, _MARKER_ITEMS, name_lower)
+    return _MARKER_ITEMS[i][1] if i is not None else None
 
 
-def _assign_markers(model_names: list[str]) -> dict[str, str]:
-    """Assign markers to all models, using predefined ones where available."""
+def _assign_markers(
+    model_names: list[str], lowered_names: list[str] | None = None
+) -> dict[str, str]:
+    """Assign markers to all models, using predefined ones where available.
+
+    Args:
+        model_names: Model names in assignment order
+        lowered_names: The same names lowercased, if already computed by the caller
+    """
+    if lowered_names is None:
+        lowered_names = [name.lower() for name in model_names]
     assignments: dict[str, str] = {}
     used_markers: set[str] = set()
     fallback_idx = 0
 
-    for name in model_names:
-        marker = _get_marker_for_model(name)
+    for name, name_lower in zip(model_names, lowered_names):
+        marker = _get_marker_for_model(name_lower)
         if marker and marker not in used_markers:
             assignments[name] = marker
             used_markers.add(marker)
@@ -166,24 +210,28 @@ def _compute_model_metrics(
     return metrics
 
 
-def _get_color_for_model(model_name: str) -> tuple[str, str]:
-    """Get (plotext_color, rich_color) for a model based on name patterns."""
-    name_lower = model_name.lower()
-    for pattern, colors in MODEL_COLOR_PATTERNS.items():
-        if pattern in name_lower:
-            return colors
-    return None, None
+def _get_color_for_model(name_lower: str) -> tuple[str, str]:
+    """Get (plotext_color, rich_color) for a lowercased model name."""
+    i = _first_pattern_index(_COLOR_RE, _COLOR_INDEX, _COLOR_ITEMS, name_lower)
+    return _COLOR_ITEMS[i][1] if i is not None else (None, None)
 
 
 def _assign_colors(
-    model_names: list[str],
+    model_names: list[str], lowered_names: list[str] | None = None
 ) -> dict[str, tuple[str, str]]:
-    """Assign colors to all models based on name patterns, with fallbacks."""
+    """Assign colors to all models based on name patterns, with fallbacks.
+
+    Args:
+        model_names: Model names in assignment order
+        lowered_names: The same names lowercased, if already computed by the caller
+    """
+    if lowered_names is None:
+        lowered_names = [name.lower() for name in model_names]
     assignments: dict[str, tuple[str, str]] = {}
     fallback_idx = 0
 
-    for name in model_names:
-        plotext_color, rich_color = _get_color_for_model(name)
+    for name, name_lower in zip(model_names, lowered_names):
+        plotext_color, rich_color = _get_color_for_model(name_lower)
         if plotext_color:
             assignments[name] = (plotext_color, rich_color)
         else:
@@ -198,25 +246,55 @@ def _assign_colors(
     return assignments
 
 
-def _print_legend(
-    metrics: list[tuple],
+# Per-model plot row: (name, success_pct, cents_per_task, time_per_task,
+# cents_per_success, marker, plotext_color, rich_color)
+PlotRow = tuple[str, float, float, float, float | None, str, str, str]
+
+
+def _build_plot_rows(
+    metrics: list[tuple[str, float, float, float, float | None]],
     marker_map: dict[str, str],
     color_map: dict[str, tuple[str, str]],
-    title: str,
-) -> None:
+) -> list[PlotRow]:
+    """Attach marker and colors to each model's metrics, with costs in cents."""
+    rows: list[PlotRow] = []
+    for name, success_pct, cost, time, cost_per_success in metrics:
+        plotext_color, rich_color = color_map[name]
+        rows.append(
+            (
+                name,
+                success_pct,
+                cost * 100,
+                time,
+                cost_per_success * 100 if cost_per_success is not None else None,
+                marker_map[name],
+                plotext_color,
+                rich_color,
+            )
+        )
+    return rows
+
+
+def _print_legend(rows: list[PlotRow], title: str) -> None:
     """Print a legend table mapping colored markers to model names."""
     console = Console()
     table = Table(title=title, show_edge=False)
     table.add_column("#", justify="right")
     table.add_column("Model", justify="left")
-    for metric in metrics:
-        name = metric[0]
-        marker = marker_map[name]
-        _, rich_color = color_map[name]
+    for name, _, _, _, _, marker, _, rich_color in rows:
         table.add_row(f"[{rich_color}]{marker}[/{rich_color}]", name)
     console.print(table)
 
 
+def _scatter_rows(rows: list[PlotRow], xs: list[float], ys: list[float]) -> None:
+    """Draw all points in one plotext call with per-point markers and colors."""
+    if not rows:
+        return
+    markers = [row[5] for row in rows]
+    colors = [row[6] for row in rows]
+    plt.scatter(xs, ys, marker=markers, color=colors)
+
+
 def _setup_plot() -> None:
     """Configure common plot settings."""
     plt.clear_figure()
@@ -226,87 +304,54 @@ def _setup_plot() -> None:
     plt.theme("clear")  # No built-in legend
 
 
-def plot_success_vs_cost(
-    metrics: list[tuple[str, float, float, float, float | None]],
-    marker_map: dict[str, str],
-    color_map: dict[str, tuple[str, str]],
-) -> None:
+def plot_success_vs_cost(rows: list[PlotRow]) -> None:
     """Plot Success % vs ¢/Task for all models."""
     _setup_plot()
     plt.title("Success % vs ¢/Task (all models)")
     plt.xlabel("¢/Task")
     plt.ylabel("Success %")
 
-    successes = [m[1] for m in metrics]
-
-    # Plot each point with its marker (convert cost to cents)
-    for i, (name, _, cost, _, _) in enumerate(metrics):
-        y = successes[i]
-        x = cost * 100  # Convert to cents
-        marker = marker_map[name]
-        plotext_color, _ = color_map[name]
-        plt.scatter([x], [y], marker=marker, color=plotext_color)
+    _scatter_rows(rows, [r[2] for r in rows], [r[1] for r in rows])
 
     plt.show()
-    _print_legend(metrics, marker_map, color_map, "Legend")
+    _print_legend(rows, "Legend")
 
 
-def plot_success_vs_time(
-    metrics: list[tuple[str, float, float, float, float | None]],
-    marker_map: dict[str, str],
-    color_map: dict[str, tuple[str, str]],
-) -> None:
+def plot_success_vs_time(rows: list[PlotRow]) -> None:
     """Plot Success % vs Time/Task for all models."""
     _setup_plot()
     plt.title("Success % vs Time/Task (all models)")
     plt.xlabel("Time/Task (seconds)")
     plt.ylabel("Success %")
 
-    successes = [m[1] for m in metrics]
-
-    for i, (name, _, _, x, _) in enumerate(metrics):
-        y = successes[i]
-        marker = marker_map[name]
-        plotext_color, _ = color_map[name]
-        plt.scatter([x], [y], marker=marker, color=plotext_color)
+    _scatter_rows(rows, [r[3] for r in rows], [r[1] for r in rows])
 
     plt.show()
-    _print_legend(metrics, marker_map, color_map, "Legend")
+    _print_legend(rows, "Legend")
 
 
-def plot_time_vs_cost_top5(
-    metrics: list[tuple[str, float, float, float, float | None]],
-    marker_map: dict[str, str],
-    color_map: dict[str, tuple[str, str]],
-) -> None:
+def plot_time_vs_cost_top5(rows: list[PlotRow]) -> None:
     """Plot Time/Task vs ¢/Task for top 5 models by success rate."""
     # Sort by success rate and take top 5
-    sorted_metrics = sorted(metrics, key=lambda m: m[1], reverse=True)[:5]
+    top_rows = sorted(rows, key=lambda r: r[1], reverse=True)[:5]
 
     _setup_plot()
     plt.title("Time/Task vs ¢/Task (top 5 by success)")
     plt.xlabel("¢/Task")
     plt.ylabel("Time/Task (s)")
 
-    for name, _, cost, time, _ in sorted_metrics:
-        marker = marker_map[name]
-        plotext_color, _ = color_map[name]
-        plt.scatter([cost * 100], [time], marker=marker, color=plotext_color)
+    _scatter_rows(top_rows, [r[2] for r in top_rows], [r[3] for r in top_rows])
 
     plt.show()
-    _print_legend(sorted_metrics, marker_map, color_map, "Legend (top 5)")
+    _print_legend(top_rows, "Legend (top 5)")
 
 
-def plot_success_vs_cost_per_success(
-    metrics: list[tuple[str, float, float, float, float | None]],
-    marker_map: dict[str, str],
-    color_map: dict[str, tuple[str, str]],
-) -> None:
+def plot_success_vs_cost_per_success(rows: list[PlotRow]) -> None:
     """Plot Success % vs ¢/Success for models with at least one success."""
     # Filter to only models with successful tasks
-    successful_metrics = [(m[0], m[1], m[4]) for m in metrics if m[4] is not None]
+    successful_rows = [r for r in rows if r[4] is not None]
 
-    if not successful_metrics:
+    if not successful_rows:
         print("No models with successful tasks to plot.")
         return
 
@@ -315,30 +360,30 @@ def plot_success_vs_cost_per_success(
     plt.xlabel("¢/Success")
     plt.ylabel("Success %")
 
-    for name, success_pct, cost_per_success in successful_metrics:
-        x = cost_per_success * 100  # Convert to cents
-        y = success_pct
-        marker = marker_map[name]
-        plotext_color, _ = color_map[name]
-        plt.scatter([x], [y], marker=marker, color=plotext_color)
+    _scatter_rows(
+        successful_rows,
+        [r[4] for r in successful_rows],
+        [r[1] for r in successful_rows],
+    )
 
     plt.show()
-    # Create filtered metrics list for legend (preserving tuple structure)
-    filtered_for_legend = [m for m in metrics if m[4] is not None]
-    _print_legend(filtered_for_legend, marker_map, color_map, "Legend")
+    _print_legend(successful_rows, "Legend")
 
 
 def show_all_plots(models: dict[str, dict]) -> None:
     """Display all four scatterplots."""
     metrics = _compute_model_metrics(models)
     model_names = [m[0] for m in metrics]
-    marker_map = _assign_markers(model_names)
-    color_map = _assign_colors(model_names)
+    # Both assignments match patterns case-insensitively; lowercase only once
+    lowered_names = [name.lower() for name in model_names]
+    marker_map = _assign_markers(model_names, lowered_names)
+    color_map = _assign_colors(model_names, lowered_names)
+    rows = _build_plot_rows(metrics, marker_map, color_map)
 
-    plot_success_vs_cost(metrics, marker_map, color_map)
+    plot_success_vs_cost(rows)
     print()
-    plot_success_vs_cost_per_success(metrics, marker_map, color_map)
+    plot_success_vs_cost_per_success(rows)
     print()
-    plot_success_vs_time(metrics, marker_map, color_map)
+    plot_success_vs_time(rows)
     print()
-    plot_time_vs_cost_top5(metrics, marker_map, color_map)
+    plot_time_vs_cost_top5(rows)
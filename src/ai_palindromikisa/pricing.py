@@ -1,10 +1,15 @@
 """Pricing calculation using LiteLLM database and OpenRouter cost data."""
 
+import functools
+
 from ai_palindromikisa.pricing_cache import get_pricing_data
 
 # Module-level cache for pricing data within a session
 _pricing_data: dict | None = None
 
+# (input, output) cost per token for each model, flattened from _pricing_data
+_rate_table: dict[str, tuple[float, float]] | None = None
+
 
 def _get_pricing_data() -> dict:
     """Get pricing data, using module-level cache for efficiency."""
@@ -14,6 +19,17 @@ def _get_pricing_data() -> dict:
     return _pricing_data
 
 
+def _get_rate_table() -> dict[str, tuple[float, float]]:
+    """Get per-token rates keyed by LiteLLM model name, built once per session."""
+    global _rate_table
+    if _rate_table is None:
+        _rate_table = {}
+        for model, (input_rate, output_rate) in _get_pricing_data().items():
+            _rate_table[model] = (input_rate, output_rate)
+    return _rate_table
+
+
+@functools.lru_cache(maxsize=512)
 def normalize_model_name_for_litellm(model_name: str) -> str | None:
     """
     Convert llm model names to LiteLLM model names.
@@ -45,17 +61,12 @@ def calculate_cost_from_tokens(
     Returns cost in USD, or None if model not found in database.
     """
     litellm_model = normalize_model_name_for_litellm(model_name)
-    pricing_data = _get_pricing_data()
-
-    if litellm_model not in pricing_data:
+    rates = _get_rate_table().get(litellm_model)
+    if rates is None:
         return None
 
-    pricing = pricing_data[litellm_model]
-
-    input_cost = input_tokens * pricing.get("input_cost_per_token", 0)
-    output_cost = output_tokens * pricing.get("output_cost_per_token", 0)
-
-    return input_cost + output_cost
+    input_rate, output_rate = rates
+    return input_tokens * input_rate + output_tokens * output_rate
 
 
 def extract_cost_from_metadata(metadata: dict) -> float | None:
@@ -2,10 +2,9 @@
 
 import json
 import time
+from dataclasses import dataclass, field
 from pathlib import Path
 
-import requests
-
 LITELLM_PRICING_URL = (
     "https://raw.githubusercontent.com/BerriAI/litellm/main/"
     "model_prices_and_context_window.json"
@@ -16,6 +15,26 @@ CACHE_METADATA_FILE = CACHE_DIR / "pricing_metadata.json"
 DEFAULT_CACHE_EXPIRY_HOURS = 24
 
 
+@dataclass(frozen=True)
+class PricingFetch:
+    """Pricing data fetched from GitHub."""
+
+    data: dict
+    # ETag and Last-Modified of the download, keyed as in the cache metadata
+    validators: dict[str, str] = field(default_factory=dict)
+    # True for a 304 response, when data is the already pruned cache
+    not_modified: bool = False
+
+
+def _read_cache_metadata() -> dict:
+    """Read the cache metadata file, or return an empty dict if unavailable."""
+    try:
+        metadata = json.loads(CACHE_METADATA_FILE.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return {}
+    return metadata if isinstance(metadata, dict) else {}
+
+
 def get_cache_age_hours() -> float | None:
     """
     Get the age of the cached pricing data in hours.
@@ -23,18 +42,11 @@ def get_cache_age_hours() -> float | None:
     Returns:
         Age in hours, or None if cache doesn't exist or metadata is invalid.
     """
-    if not CACHE_METADATA_FILE.exists():
-        return None
-
-    try:
-        metadata = json.loads(CACHE_METADATA_FILE.read_text(encoding="utf-8"))
-        fetch_time = metadata.get("fetch_timestamp")
-        if fetch_time is None:
-            return None
-        age_seconds = time.time() - fetch_time
-        return age_seconds / 3600
-    except (json.JSONDecodeError, OSError):
+    fetch_time = _read_cache_metadata().get("fetch_timestamp")
+    if fetch_time is None:
         return None
+    age_seconds = time.time() - fetch_time
+    return age_seconds / 3600
 
 
 def is_cache_fresh(max_age_hours: float = DEFAULT_CACHE_EXPIRY_HOURS) -> bool:
@@ -53,28 +65,84 @@ def is_cache_fresh(max_age_hours: float = DEFAULT_CACHE_EXPIRY_HOURS) -> bool:
     return age < max_age_hours
 
 
-def fetch_pricing_from_github() -> dict | None:
+def fetch_pricing_from_github() -> PricingFetch | None:
     """
     Fetch pricing data from LiteLLM GitHub repository.
 
+    The ETag and Last-Modified values saved with the cache are sent along, so
+    an unchanged upstream file costs only a 304 response. The cached data is
+    then marked fresh and returned without downloading it again.
+
     Returns:
-        Pricing dictionary, or None if fetch failed.
+        The fetched pricing data, or None if fetch failed.
     """
+    # requests is slow to import and only needed when the cache is refreshed
+    import requests
+
+    metadata = _read_cache_metadata() if CACHE_FILE.exists() else {}
+    headers = {}
+    if metadata.get("etag"):
+        headers["If-None-Match"] = metadata["etag"]
+    if metadata.get("last_modified"):
+        headers["If-Modified-Since"] = metadata["last_modified"]
+
     try:
-        response = requests.get(LITELLM_PRICING_URL, timeout=30)
+        response = requests.get(LITELLM_PRICING_URL, timeout=30, headers=headers)
+        if response.status_code == 304:
+            cached_data = load_pricing_from_cache()
+            if cached_data is not None:
+                metadata["fetch_timestamp"] = time.time()
+                try:
+                    _write_cache_metadata(metadata)
+                except OSError as e:
+                    print(f"Warning: Failed to save pricing cache: {e}")
+                return PricingFetch(cached_data, not_modified=True)
+            # The local cache is gone or unreadable, so download the file in full
+            response = requests.get(LITELLM_PRICING_URL, timeout=30)
         response.raise_for_status()
-        return response.json()
+        validators = {}
+        for header, key in (("ETag", "etag"), ("Last-Modified", "last_modified")):
+            value = response.headers.get(header)
+            if isinstance(value, str):
+                validators[key] = value
+        return PricingFetch(response.json(), validators)
     except (requests.RequestException, json.JSONDecodeError) as e:
         print(f"Warning: Failed to fetch pricing from GitHub: {e}")
         return None
 
 
-def save_pricing_to_cache(pricing_data: dict) -> bool:
+def prune_pricing_data(pricing_data: dict) -> dict[str, list[float]]:
+    """
+    Reduce LiteLLM pricing data to the per-token rates used for cost calculation.
+
+    Args:
+        pricing_data: Pricing dictionary as published by LiteLLM.
+
+    Returns:
+        Dictionary mapping model name to [input_cost_per_token, output_cost_per_token].
+    """
+    return {
+        model: [
+            pricing.get("input_cost_per_token", 0),
+            pricing.get("output_cost_per_token", 0),
+        ]
+        for model, pricing in pricing_data.items()
+        if isinstance(pricing, dict)
+    }
+
+
+def save_pricing_to_cache(
+    pricing_data: dict, validators: dict[str, str] | None = None
+) -> bool:
     """
     Save pricing data to local cache.
 
+    Only the per-token rates are kept, see prune_pricing_data().
+
     Args:
         pricing_data: The pricing dictionary to cache.
+        validators: HTTP validators of the download, stored in the metadata
+            for the next conditional request.
 
     Returns:
         True if save succeeded, False otherwise.
@@ -83,14 +151,16 @@ def save_pricing_to_cache(pricing_data: dict) -> bool:
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
         # Save pricing data
-        CACHE_FILE.write_text(json.dumps(pricing_data, indent=2), encoding="utf-8")
+        pruned_data = prune_pricing_data(pricing_data)
+        CACHE_FILE.write_text(json.dumps(pruned_data, indent=2), encoding="utf-8")
 
         # Save metadata with timestamp
         metadata = {
             "fetch_timestamp": time.time(),
             "source_url": LITELLM_PRICING_URL,
+            **(validators or {}),
         }
-        CACHE_METADATA_FILE.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+        _write_cache_metadata(metadata)
 
         return True
     except OSError as e:
@@ -98,21 +168,34 @@ def save_pricing_to_cache(pricing_data: dict) -> bool:
         return False
 
 
+def _write_cache_metadata(metadata: dict) -> None:
+    """Write the cache metadata file."""
+    CACHE_METADATA_FILE.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+
+
 def load_pricing_from_cache() -> dict | None:
     """
     Load pricing data from local cache.
 
     Returns:
-        Pricing dictionary, or None if cache doesn't exist or is invalid.
+        Dictionary mapping model name to [input_cost_per_token,
+        output_cost_per_token], or None if cache doesn't exist or is invalid.
     """
     if not CACHE_FILE.exists():
         return None
 
     try:
-        return json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+        data = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
     except (json.JSONDecodeError, OSError) as e:
         print(f"Warning: Failed to load pricing cache: {e}")
         return None
+    if not isinstance(data, dict):
+        print("Warning: Failed to load pricing cache: not a JSON object")
+        return None
+    if any(isinstance(pricing, dict) for pricing in data.values()):
+        # Written before the cache was pruned, so it still holds full entries
+        data = prune_pricing_data(data)
+    return data
 
 
 def get_pricing_data(force_refresh: bool = False) -> dict:
@@ -130,24 +213,30 @@ def get_pricing_data(force_refresh: bool = False) -> dict:
         force_refresh: If True, always fetch fresh data from GitHub.
 
     Returns:
-        Pricing dictionary with model pricing information, or empty dict.
+        Dictionary mapping model name to [input_cost_per_token,
+        output_cost_per_token], or empty dict.
     """
+    # Read the metadata once; a failed fetch below leaves it unchanged, so the
+    # same age also serves the stale cache warning
+    age = get_cache_age_hours()
+
     # Check if we should use cache
-    if not force_refresh and is_cache_fresh():
+    if not force_refresh and age is not None and age < DEFAULT_CACHE_EXPIRY_HOURS:
         cached_data = load_pricing_from_cache()
         if cached_data is not None:
             return cached_data
 
     # Try to fetch from GitHub
-    github_data = fetch_pricing_from_github()
-    if github_data is not None:
-        save_pricing_to_cache(github_data)
-        return github_data
+    fetched = fetch_pricing_from_github()
+    if fetched is not None:
+        if fetched.not_modified:
+            return fetched.data
+        save_pricing_to_cache(fetched.data, fetched.validators)
+        return prune_pricing_data(fetched.data)
 
     # Try to load stale cache if GitHub failed
     cached_data = load_pricing_from_cache()
     if cached_data is not None:
-        age = get_cache_age_hours()
         if age is not None:
             print(f"Warning: Using stale pricing cache ({age:.1f} hours old)")
         return cached_data
@@ -164,10 +253,13 @@ def update_pricing_cache() -> bool:
     Returns:
         True if update succeeded, False otherwise.
     """
-    github_data = fetch_pricing_from_github()
-    if github_data is None:
+    fetched = fetch_pricing_from_github()
+    if fetched is None:
         return False
-    return save_pricing_to_cache(github_data)
+    if fetched.not_modified:
+        # The cache already holds this data and was just marked fresh
+        return True
+    return save_pricing_to_cache(fetched.data, fetched.validators)
 
 
 def update_pricing_cli() -> None:
@@ -1,27 +1,93 @@
 """Local development server for the web interface with live reload."""
 
+import hashlib
 import json
+import os
 import shutil
 from pathlib import Path
 
 from ai_palindromikisa.export_json import export_json
 from ai_palindromikisa.paths import BENCHMARK_LOGS_DIR, WEB_DIR
 
+# Digest of the data.json last written to each output path
+_last_data_hash: dict[Path, bytes] = {}
 
-def build_site(output_dir: Path) -> None:
-    """Build the site into the output directory."""
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink src to dst, copying instead when linking is not possible.
+
+    Nothing is done when dst already is a link to src or a copy at least as new.
+    """
+    src_stat = src.stat()
+    try:
+        dst_stat = dst.stat()
+    except FileNotFoundError:
+        pass
+    else:
+        if (
+            os.path.samestat(src_stat, dst_stat)
+            or dst_stat.st_mtime_ns >= src_stat.st_mtime_ns
+        ):
+            return
+        dst.unlink()
+    try:
+        os.link(src, dst)
+    except OSError:
+        # e.g. source and output on different filesystems; file metadata isn't
+        # needed for served assets, so copy the contents only
+        shutil.copyfile(src, dst)
+
+
+def _write_data(output_dir: Path) -> None:
+    """Export the benchmark data to data.json in the output directory."""
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Export JSON data
     data = export_json()
-    (output_dir / "data.json").write_text(
-        json.dumps(data, indent=2, ensure_ascii=False)
-    )
+    data_path = output_dir / "data.json"
+
+    # Only the web frontend reads this file, so skip pretty-printing
+    encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+    # generated_at differs on every export, so leave it out of the digest;
+    # data.json is left untouched when nothing else has changed
+    hasher = hashlib.blake2b(digest_size=16)
+    payload = {key: value for key, value in data.items() if key != "generated_at"}
+    for chunk in encoder.iterencode(payload):
+        hasher.update(chunk.encode("utf-8"))
+    digest = hasher.digest()
+    if _last_data_hash.get(data_path) == digest and data_path.exists():
+        return
+
+    # Stream the encoded chunks to a temporary file, so the serialized document
+    # is never held in memory as a whole
+    tmp_path = output_dir / f".data.json.{os.getpid()}.tmp"
+    try:
+        with tmp_path.open("wb", buffering=1 << 16) as fp:
+            for chunk in encoder.iterencode(data):
+                fp.write(chunk.encode("utf-8"))
+        tmp_path.replace(data_path)
+    except BaseException:
+        # Don't leave a partial temporary file behind, e.g. on Ctrl+C
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _last_data_hash[data_path] = digest
+
+
+def _copy_static(output_dir: Path) -> None:
+    """Copy the static web files into the output directory."""
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Copy static files
-    for file in WEB_DIR.iterdir():
-        if file.is_file():
-            shutil.copy(file, output_dir / file.name)
+    # DirEntry.is_file() uses the file type from the directory read, no stat()
+    with os.scandir(WEB_DIR) as it:
+        for entry in it:
+            if entry.is_file():
+                _link_or_copy(Path(entry.path), output_dir / entry.name)
+
+
+def build_site(output_dir: Path) -> None:
+    """Build the site into the output directory."""
+    _write_data(output_dir)
+    _copy_static(output_dir)
 
 
 def serve_site(port: int, build_only: bool, output: str) -> None:
@@ -32,8 +98,6 @@ def serve_site(port: int, build_only: bool, output: str) -> None:
         build_only: If True, only build without starting server.
         output: Output directory path.
     """
-    from livereload import Server
-
     output_path = Path(output)
 
     print(f"Building site to {output_path}/...")
@@ -43,18 +107,21 @@ def serve_site(port: int, build_only: bool, output: str) -> None:
     if build_only:
         return
 
+    # livereload pulls in tornado, which --build-only doesn't need
+    from livereload import Server
+
     # Create livereload server
     server = Server()
 
-    # Watch benchmark_logs for changes and rebuild
+    # Watch benchmark_logs for changes and re-export the data
     if BENCHMARK_LOGS_DIR.exists():
         server.watch(
             str(BENCHMARK_LOGS_DIR / "*.yaml"),
-            lambda: build_site(output_path),
+            lambda: _write_data(output_path),
         )
 
-    # Watch web source files for changes
-    server.watch(str(WEB_DIR / "*"), lambda: build_site(output_path))
+    # Web source edits only need the static files refreshed, not a data export
+    server.watch(str(WEB_DIR / "*"), lambda: _copy_static(output_path))
 
     print(f"Watching {BENCHMARK_LOGS_DIR}/*.yaml and {WEB_DIR}/* for changes...")
     print("Press Ctrl+C to stop.")
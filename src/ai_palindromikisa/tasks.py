@@ -1,13 +1,12 @@
-from ruamel.yaml import YAML
-
 from ai_palindromikisa.paths import BASIC_TASKS_FILE
+from ai_palindromikisa.yaml_io import load_yaml_cached
 
 
 def load_tasks() -> tuple[str, list]:
-    """Load benchmark tasks from the basic_tasks.yaml file."""
-    # Use ruamel.yaml to preserve original formatting
-    yaml_obj = YAML()
-    yaml_obj.preserve_quotes = True
-    data = yaml_obj.load(BASIC_TASKS_FILE.read_text(encoding="utf-8"))
+    """Load benchmark tasks from the basic_tasks.yaml file.
 
+    The parsed tasks are reused until the file changes on disk, so callers
+    share the returned list and must not modify it.
+    """
+    data = load_yaml_cached(BASIC_TASKS_FILE)
     return data["system_prompt"], data["tasks"]
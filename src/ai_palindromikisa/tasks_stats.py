@@ -1,9 +1,10 @@
 """Task statistics module for displaying benchmark task performance across models."""
 
-from collections import defaultdict
+import functools
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import cast
 
-import yaml
 from rich.console import Console
 from rich.table import Table
 
@@ -16,6 +17,34 @@ from ai_palindromikisa.plots import (
     _assign_markers,
 )
 from ai_palindromikisa.tasks import load_tasks
+from ai_palindromikisa.yaml_io import forget_yaml, load_yaml_files_cached
+
+# (logs directory, its mtime) and the sorted log paths listed at that time
+_log_list_cache: tuple[tuple[Path, int], list[Path]] | None = None
+
+# Shared stand-in for tasks without metadata; never modified
+_NO_METADATA: dict = {}
+
+
+@dataclass(slots=True)
+class ModelResult:
+    """One model's result for a task."""
+
+    correct: bool
+    time: float
+    cost: float
+
+
+@dataclass(slots=True)
+class TaskStats:
+    """Results of all models for one task, with running totals."""
+
+    reference: str = ""
+    total_time: float = 0.0
+    total_cost: float = 0.0
+    success_count: int = 0
+    attempt_count: int = 0
+    model_results: dict[str, ModelResult] = field(default_factory=dict)
 
 
 def _extract_model_name(model_path: str) -> str:
@@ -29,6 +58,7 @@ def _extract_model_name(model_path: str) -> str:
     return get_display_name_from_path(model_path)
 
 
+@functools.lru_cache(maxsize=256)
 def _get_rich_color_for_model(model_name: str) -> str:
     """Get rich color for a model based on name patterns."""
     name_lower = model_name.lower()
@@ -38,6 +68,7 @@ def _get_rich_color_for_model(model_name: str) -> str:
     return FALLBACK_RICH_COLORS[0]
 
 
+@functools.lru_cache(maxsize=256)
 def _get_marker_for_model(model_name: str) -> str | None:
     """Get predefined marker for a model name, or None if not found."""
     name_lower = model_name.lower()
@@ -47,11 +78,24 @@ def _get_marker_for_model(model_name: str) -> str | None:
     return None
 
 
+def _list_logs() -> list[Path]:
+    """List the benchmark logs, sorted by name.
+
+    Adding, removing or renaming a log updates the directory mtime, so the
+    directory is only rescanned when that changes.
+    """
+    global _log_list_cache
+    signature = (BENCHMARK_LOGS_DIR, BENCHMARK_LOGS_DIR.stat().st_mtime_ns)
+    if _log_list_cache is None or _log_list_cache[0] != signature:
+        _log_list_cache = (signature, sorted(BENCHMARK_LOGS_DIR.glob("*.yaml")))
+    return _log_list_cache[1]
+
+
 def load_task_stats() -> dict:
     """Load and aggregate task statistics from benchmark logs.
 
     Returns a dict with:
-        - tasks: dict mapping prompt -> task stats
+        - tasks: dict mapping prompt -> TaskStats
         - models: list of model names sorted by success rate
         - marker_map: dict mapping model name to marker
         - color_map: dict mapping model name to rich color
@@ -63,54 +107,65 @@ def load_task_stats() -> dict:
     _, reference_tasks = load_tasks()
     reference_map = {task["prompt"]: task["reference"] for task in reference_tasks}
 
-    # Aggregate by task prompt
-    tasks: dict[str, dict] = defaultdict(
-        lambda: {
-            "model_results": {},  # model_name -> {"correct": bool, "time": float, "cost": float}
-            "total_time": 0.0,
-            "total_cost": 0.0,
-            "success_count": 0,
-            "attempt_count": 0,
-            "reference": "",
-        }
-    )
+    # Aggregate by task prompt, in order of first appearance in the logs
+    tasks: dict[str, TaskStats] = {}
 
     # Track all models for marker/color assignment
     all_models: set[str] = set()
-    model_success_counts: dict[str, tuple[int, int]] = defaultdict(lambda: (0, 0))
+    # Correct and total task counts per model, for sorting by success rate
+    model_correct_counts: dict[str, int] = {}
+    model_total_counts: dict[str, int] = {}
+
+    yaml_files = _list_logs()
+    # Forget deleted logs
+    forget_yaml(BENCHMARK_LOGS_DIR, keep=set(yaml_files))
+
+    # Repeated aggregations (e.g. livereload rebuilds) only reparse changed logs
+    parsed = load_yaml_files_cached(yaml_files)
 
-    yaml_files = list(BENCHMARK_LOGS_DIR.glob("*.yaml"))
+    # Logs of the same model configuration share a model path; load each once
+    model_names: dict[str, str] = {}
 
-    for yaml_file in sorted(yaml_files):
+    for yaml_file, parsed_data in zip(yaml_files, parsed):
+        if isinstance(parsed_data, Exception):
+            print(f"Error processing {yaml_file.name}: {parsed_data}")
+            continue
         try:
-            data = cast("dict", yaml.safe_load(yaml_file.read_text(encoding="utf-8")))
-            model_path = data.get("model", "Unknown")
-            model_name = _extract_model_name(cast("str", model_path))
+            data = cast("dict", parsed_data)
+            model_path = cast("str", data.get("model", "Unknown"))
+            model_name = model_names.get(model_path)
+            if model_name is None:
+                model_name = model_names[model_path] = _extract_model_name(model_path)
             all_models.add(model_name)
 
-            for task in data.get("tasks", []):
+            for task in data.get("tasks") or ():
                 prompt = task.get("prompt", "")
                 is_correct = task.get("is_correct", False)
                 duration = task.get("duration_seconds", 0)
-                cost = task.get("metadata", {}).get("cost_usd", 0) or 0
-
-                tasks[prompt]["model_results"][model_name] = {
-                    "correct": is_correct,
-                    "time": duration,
-                    "cost": cost,
-                }
-                tasks[prompt]["total_time"] += duration
-                tasks[prompt]["total_cost"] += cost
-                tasks[prompt]["attempt_count"] += 1
+                cost = (task.get("metadata") or _NO_METADATA).get("cost_usd") or 0
+
+                entry = tasks.get(prompt)
+                if entry is None:
+                    entry = tasks[prompt] = TaskStats(
+                        reference=reference_map.get(prompt, "")
+                    )
+
+                entry.model_results[model_name] = ModelResult(
+                    correct=is_correct, time=duration, cost=cost
+                )
+                entry.total_time += duration
+                entry.total_cost += cost
+                entry.attempt_count += 1
                 if is_correct:
-                    tasks[prompt]["success_count"] += 1
-                tasks[prompt]["reference"] = reference_map.get(prompt, "")
+                    entry.success_count += 1
 
                 # Track model success for sorting
-                correct, total = model_success_counts[model_name]
-                model_success_counts[model_name] = (
-                    correct + (1 if is_correct else 0),
-                    total + 1,
+                if is_correct:
+                    model_correct_counts[model_name] = (
+                        model_correct_counts.get(model_name, 0) + 1
+                    )
+                model_total_counts[model_name] = (
+                    model_total_counts.get(model_name, 0) + 1
                 )
 
         except Exception as e:
@@ -120,8 +175,8 @@ def load_task_stats() -> dict:
     sorted_models = sorted(
         all_models,
         key=lambda m: (
-            model_success_counts[m][0] / model_success_counts[m][1]
-            if model_success_counts[m][1] > 0
+            model_correct_counts.get(m, 0) / model_total_counts[m]
+            if model_total_counts.get(m, 0) > 0
             else 0
         ),
         reverse=True,
@@ -132,30 +187,38 @@ def load_task_stats() -> dict:
     color_map = {m: _get_rich_color_for_model(m) for m in sorted_models}
 
     return {
-        "tasks": dict(tasks),
+        "tasks": tasks,
         "models": sorted_models,
         "marker_map": marker_map,
         "color_map": color_map,
     }
 
 
-def _build_success_map(
-    task_data: dict,
+def _build_model_styles(
     models: list[str],
     marker_map: dict[str, str],
     color_map: dict[str, str],
+) -> dict[str, str]:
+    """Build the colored marker markup of each model once for all table rows."""
+    return {
+        model: f"[{color_map[model]}]{marker_map[model]}[/{color_map[model]}]"
+        for model in models
+    }
+
+
+def _build_success_map(
+    task_data: TaskStats,
+    models: list[str],
+    model_styles: dict[str, str],
 ) -> str:
     """Build a colored success map string for a task."""
-    parts = []
-    for model in models:
-        result = task_data["model_results"].get(model)
-        if result and result["correct"]:
-            marker = marker_map[model]
-            color = color_map[model]
-            parts.append(f"[{color}]{marker}[/{color}]")
-        else:
-            parts.append(" ")
-    return "".join(parts)
+    model_results = task_data.model_results
+    return "".join(
+        model_styles[model]
+        if (result := model_results.get(model)) and result.correct
+        else " "
+        for model in models
+    )
 
 
 def display_task_stats() -> None:
@@ -175,13 +238,13 @@ def display_task_stats() -> None:
     # Calculate task metrics and sort by success percentage
     task_metrics = []
     for prompt, data in tasks.items():
-        if data["attempt_count"] == 0:
+        if data.attempt_count == 0:
             continue
-        success_pct = (data["success_count"] / data["attempt_count"]) * 100
-        avg_time = data["total_time"] / data["attempt_count"]
-        avg_cost = data["total_cost"] / data["attempt_count"]
+        success_pct = (data.success_count / data.attempt_count) * 100
+        avg_time = data.total_time / data.attempt_count
+        avg_cost = data.total_cost / data.attempt_count
         task_metrics.append(
-            (prompt, success_pct, avg_time, avg_cost, data["reference"], data)
+            (prompt, success_pct, avg_time, avg_cost, data.reference, data)
         )
 
     # Sort by success percentage (descending)
@@ -198,8 +261,9 @@ def display_task_stats() -> None:
     table.add_column("Answer", justify="left", overflow="ellipsis", ratio=1)
     table.add_column("Prompt", justify="left", overflow="ellipsis", ratio=2)
 
+    model_styles = _build_model_styles(models, marker_map, color_map)
     for prompt, success_pct, avg_time, avg_cost, reference, data in task_metrics:
-        success_map = _build_success_map(data, models, marker_map, color_map)
+        success_map = _build_success_map(data, models, model_styles)
         avg_cost_cents = avg_cost * 100
         table.add_row(
             f"{success_pct:.0f}%",
@@ -219,8 +283,6 @@ def display_task_stats() -> None:
     legend_table.add_column("Model", justify="left")
 
     for model in models:
-        marker = marker_map[model]
-        color = color_map[model]
-        legend_table.add_row(f"[{color}]{marker}[/{color}]", model)
+        legend_table.add_row(model_styles[model], model)
 
     console.print(legend_table)
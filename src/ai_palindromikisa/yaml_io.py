@@ -0,0 +1,270 @@
+"""Shared YAML reading and writing helpers.
+
+PyYAML handles parsing and writing new log entries. Commands that rewrite
+existing files use ruamel.yaml round-tripping, so the rest of the file keeps
+its layout.
+"""
+
+import os
+import re
+from collections.abc import Collection, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import yaml
+
+# Prefer the LibYAML C bindings for parsing, fall back to the pure-Python loader
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from ruamel.yaml import YAML
+
+# Parsed documents keyed by path, with the (mtime_ns, size) of the file they
+# were read from or written to, so that only new or changed files are parsed again
+_yaml_cache: dict[Path, tuple[tuple[int, int], Any]] = {}
+
+# A block sequence indented deeper than the key it belongs to
+_INDENTED_SEQUENCE = re.compile(r"^( *)[^ \n#-][^\n]*:\n\1 +- ", re.MULTILINE)
+
+
+def load_yaml(path: Path) -> Any:
+    """Parse a YAML file with the fastest available safe loader.
+
+    Args:
+        path: File to read; raw bytes are handed to the parser, which decodes them
+
+    Returns:
+        The parsed document
+    """
+    return yaml.load(path.read_bytes(), Loader=SafeLoader)
+
+
+def file_signature(stat: os.stat_result) -> tuple[int, int]:
+    """Build the (mtime_ns, size) key telling whether a file has changed."""
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def load_yaml_cached(path: Path, stat: os.stat_result | None = None) -> Any:
+    """Parse a YAML file, reusing the previous result while the file is unchanged.
+
+    The returned document is shared between callers and must not be mutated.
+
+    Args:
+        path: File to read
+        stat: The file's stat result, if the caller already has one
+
+    Returns:
+        The parsed document
+    """
+    if stat is None:
+        stat = path.stat()
+    signature = file_signature(stat)
+    cached = _yaml_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    data = load_yaml(path)
+    _yaml_cache[path] = (signature, data)
+    return data
+
+
+def _load_yaml_or_error(path: Path, stat: os.stat_result | None = None) -> Any:
+    """Run load_yaml_cached(), returning the exception instead of raising it."""
+    try:
+        return load_yaml_cached(path, stat)
+    except Exception as e:
+        return e
+
+
+def load_yaml_files_cached(
+    paths: Sequence[Path], stats: Sequence[os.stat_result | None] | None = None
+) -> list[Any]:
+    """Parse several YAML files with load_yaml_cached().
+
+    Unchanged files come from the cache. The rest are independent, so their
+    reads and parses overlap in a thread pool.
+
+    Args:
+        paths: Files to read
+        stats: Stat results of the files, if the caller already has them
+
+    Returns:
+        The parsed documents in the order of paths. A file that can't be read
+        or parsed has the exception in its place instead of raising it.
+    """
+    if stats is None:
+        stats = [None] * len(paths)
+    results: list[Any] = [None] * len(paths)
+    misses = []
+    for i, (path, stat) in enumerate(zip(paths, stats)):
+        cached = _yaml_cache.get(path)
+        if (
+            stat is not None
+            and cached is not None
+            and cached[0] == file_signature(stat)
+        ):
+            results[i] = cached[1]
+        else:
+            misses.append(i)
+    if misses:
+        max_workers = min(16, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            loaded = executor.map(
+                _load_yaml_or_error,
+                [paths[i] for i in misses],
+                [stats[i] for i in misses],
+            )
+            for i, data in zip(misses, loaded):
+                results[i] = data
+    return results
+
+
+def remember_yaml(path: Path, data: Any) -> tuple[int, int]:
+    """Cache a document as the parsed contents of a file just written from it.
+
+    Returns:
+        The signature of the file the document was cached for
+    """
+    signature = file_signature(path.stat())
+    _yaml_cache[path] = (signature, data)
+    return signature
+
+
+def forget_yaml(directory: Path, keep: Collection[Path] = ()) -> None:
+    """Drop cached documents of the files in a directory.
+
+    Args:
+        directory: Directory whose files are forgotten
+        keep: Files to keep cached, e.g. the ones still present
+    """
+    for path in [p for p in _yaml_cache if p.parent == directory and p not in keep]:
+        del _yaml_cache[path]
+
+
+class LogDumper(yaml.SafeDumper):
+    """Dumper producing the layout used by benchmark log files.
+
+    Block sequences are indented under their parent key, multi-line strings
+    use literal block style and floats are never written in scientific notation.
+    Shared objects are written out in full instead of as anchors and aliases, so
+    separately dumped fragments can be concatenated into one valid document.
+    """
+
+    def increase_indent(self, flow: bool = False, indentless: bool = False) -> None:
+        return super().increase_indent(flow, False)
+
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+
+def _represent_str(dumper: yaml.SafeDumper, data: str) -> yaml.ScalarNode:
+    """Use literal block style for multi-line strings."""
+    if "\n" in data:
+        return dumper.represent_scalar("tag:yaml.org,2002:str", data, style="|")
+    return dumper.represent_scalar("tag:yaml.org,2002:str", data)
+
+
+def _represent_float(dumper: yaml.SafeDumper, value: float) -> yaml.ScalarNode:
+    """Format floats to avoid scientific notation, up to 10 decimal places."""
+    if value != value:  # NaN
+        return dumper.represent_scalar("tag:yaml.org,2002:float", ".nan")
+    if value == float("inf"):
+        return dumper.represent_scalar("tag:yaml.org,2002:float", ".inf")
+    if value == float("-inf"):
+        return dumper.represent_scalar("tag:yaml.org,2002:float", "-.inf")
+    formatted = f"{value:.10f}".rstrip("0").rstrip(".")
+    if "." not in formatted:
+        formatted += ".0"
+    return dumper.represent_scalar("tag:yaml.org,2002:float", formatted)
+
+
+LogDumper.add_representer(str, _represent_str)
+LogDumper.add_representer(float, _represent_float)
+
+
+def dump_log_yaml(data: Any) -> str:
+    """Serialize data in the benchmark log layout.
+
+    Args:
+        data: Document to serialize; mapping key order is preserved
+
+    Returns:
+        YAML text
+    """
+    return yaml.dump(
+        data,
+        Dumper=LogDumper,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+        width=4096,
+    )
+
+
+def write_bytes_atomic(path: Path, payload: bytes) -> None:
+    """Write a file via a temporary sibling and rename it into place.
+
+    Readers never see a partially written file. The parent directory is only
+    created when the first write attempt finds it missing, and the temporary
+    file is removed if writing or renaming fails.
+
+    Args:
+        path: File to write
+        payload: Complete new contents of the file
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        try:
+            tmp_path.write_bytes(payload)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(payload)
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def load_yaml_round_trip(path: Path) -> tuple["YAML", Any]:
+    """Parse a YAML file so that it can be rewritten with its layout intact.
+
+    Quoting, folded and literal scalars and key order are kept. Existing logs
+    use both indented and indentless block sequences, so the style found in
+    the file is kept too.
+
+    Args:
+        path: File to read
+
+    Returns:
+        The configured ruamel.yaml instance and the parsed document, to be
+        passed to dump_yaml_round_trip()
+    """
+    # Imported here because only the commands rewriting existing files need it
+    from ruamel.yaml import YAML
+
+    text = path.read_text(encoding="utf-8")
+    yaml_obj = YAML()
+    yaml_obj.preserve_quotes = True
+    yaml_obj.default_flow_style = False
+    yaml_obj.allow_unicode = True
+    yaml_obj.width = 4096  # Prevent line wrapping
+    if _INDENTED_SEQUENCE.search(text):
+        yaml_obj.indent(mapping=2, sequence=4, offset=2)
+    return yaml_obj, yaml_obj.load(text)
+
+
+def dump_yaml_round_trip(yaml_obj: "YAML", path: Path, data: Any) -> None:
+    """Write a document loaded by load_yaml_round_trip() back to a file.
+
+    Args:
+        yaml_obj: The ruamel.yaml instance returned with the document
+        path: File to write, atomically
+        data: The possibly modified document
+    """
+    stream = StringIO()
+    yaml_obj.dump(data, stream)
+    write_bytes_atomic(path, stream.getvalue().encode("utf-8"))
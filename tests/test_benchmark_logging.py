@@ -9,8 +9,15 @@ import yaml
 
 import ai_palindromikisa.logs
 import ai_palindromikisa.paths
-from ai_palindromikisa.logs import get_existing_logs, get_log_path, save_task_result
+import ai_palindromikisa.yaml_io
+from ai_palindromikisa.logs import (
+    append_task_results,
+    get_existing_logs,
+    get_log_path,
+    save_task_result,
+)
 from ai_palindromikisa.models import ModelConfig
+from ai_palindromikisa.yaml_io import dump_log_yaml
 
 
 class TestGetLogPath:
@@ -44,6 +51,18 @@ class TestGetLogPath:
 
         assert log_path.name.endswith(expected_suffix)
 
+    def test_does_not_create_directory(self, tmp_path: Path):
+        """Test that the directory is left to be created by the first write."""
+        benchmark_logs_dir = tmp_path / "benchmark_logs"
+
+        with mock.patch.object(
+            ai_palindromikisa.logs, "BENCHMARK_LOGS_DIR", benchmark_logs_dir
+        ):
+            log_path = get_log_path(ModelConfig(name="test/model"))
+
+        assert log_path.parent == benchmark_logs_dir
+        assert not benchmark_logs_dir.exists()
+
 
 class TestCreateLogFileIntegration:
     """Integration tests for save_task_result function."""
@@ -267,6 +286,152 @@ Ympäröi luomasi palindromi XML-tageilla <PALINDROMI> ja </PALINDROMI>.
             assert date_part[4] == "-" and date_part[7] == "-"
 
 
+class TestSaveLog:
+    """Tests for save_log function."""
+
+    def test_replaces_file_without_leftovers(self, tmp_path: Path):
+        """Test that the log is replaced whole and no temporary file remains."""
+        log_path = tmp_path / "2025-01-01-test-model.yaml"
+        log_path.write_text("tasks: []\n")
+
+        ai_palindromikisa.logs.save_log(log_path, {"tasks": [{"prompt": "a"}]})
+
+        assert [path.name for path in tmp_path.iterdir()] == [log_path.name]
+        assert yaml.safe_load(log_path.read_text()) == {"tasks": [{"prompt": "a"}]}
+
+    def test_interrupted_write_keeps_previous_log(self, tmp_path: Path):
+        """Test that a failing write leaves the existing log intact."""
+        log_path = tmp_path / "2025-01-01-test-model.yaml"
+        log_path.write_text("tasks: []\n")
+
+        with (
+            mock.patch.object(Path, "replace", side_effect=OSError("disk full")),
+            pytest.raises(OSError),
+        ):
+            ai_palindromikisa.logs.save_log(log_path, {"tasks": [{"prompt": "a"}]})
+
+        assert log_path.read_text() == "tasks: []\n"
+        assert list(tmp_path.iterdir()) == [log_path]
+
+
+class TestAppendTaskResults:
+    """Tests for append_task_results function."""
+
+    SYSTEM_PROMPT = "Test system prompt\n{prompt}"
+
+    def test_appends_all_results_in_one_write(self, tmp_path: Path):
+        """Test that a batch of results is written with a single save."""
+        config = ModelConfig(name="test/model")
+        results = [
+            {"prompt": "first", "answer": "a", "is_correct": True},
+            {"prompt": "second", "answer": "b", "is_correct": False},
+        ]
+
+        with (
+            mock.patch.object(
+                ai_palindromikisa.logs, "BENCHMARK_LOGS_DIR", tmp_path / "logs"
+            ),
+            mock.patch.object(
+                ai_palindromikisa.logs,
+                "save_log",
+                wraps=ai_palindromikisa.logs.save_log,
+            ) as save_log,
+        ):
+            log_path = append_task_results(config, self.SYSTEM_PROMPT, results)
+
+        assert save_log.call_count == 1
+        data = cast("dict", yaml.safe_load(log_path.read_text(encoding="utf-8")))
+        assert [task["prompt"] for task in data["tasks"]] == ["first", "second"]
+
+    def test_reuses_own_write_without_parsing(self, tmp_path: Path):
+        """Test that a log written by this process is not parsed again."""
+        config = ModelConfig(name="test/model")
+
+        with mock.patch.object(
+            ai_palindromikisa.logs, "BENCHMARK_LOGS_DIR", tmp_path / "logs"
+        ):
+            append_task_results(config, self.SYSTEM_PROMPT, [{"prompt": "first"}])
+            with mock.patch.object(ai_palindromikisa.yaml_io, "load_yaml") as load:
+                log_path = append_task_results(
+                    config, self.SYSTEM_PROMPT, [{"prompt": "second"}]
+                )
+
+        load.assert_not_called()
+        data = cast("dict", yaml.safe_load(log_path.read_text(encoding="utf-8")))
+        assert [task["prompt"] for task in data["tasks"]] == ["first", "second"]
+
+    def test_appends_to_own_log_without_rewriting(self, tmp_path: Path):
+        """Test that later appends add text to the file instead of rewriting it."""
+        config = ModelConfig(name="test/model")
+        results = [
+            {"prompt": "first", "answer": "a\nb", "duration_seconds": 1.5},
+            {"prompt": "second", "answer": "c", "metadata": {"cost_usd": 1.2e-05}},
+        ]
+
+        with (
+            mock.patch.object(
+                ai_palindromikisa.logs, "BENCHMARK_LOGS_DIR", tmp_path / "logs"
+            ),
+            mock.patch.object(
+                ai_palindromikisa.logs,
+                "save_log",
+                wraps=ai_palindromikisa.logs.save_log,
+            ) as save_log,
+        ):
+            append_task_results(config, self.SYSTEM_PROMPT, results[:1])
+            log_path = append_task_results(config, self.SYSTEM_PROMPT, results[1:])
+
+        assert save_log.call_count == 1
+        data = cast("dict", yaml.safe_load(log_path.read_text(encoding="utf-8")))
+        assert data["tasks"] == results
+        assert log_path.read_text(encoding="utf-8") == dump_log_yaml(data)
+
+    def test_appended_shared_objects_stay_loadable(self, tmp_path: Path):
+        """Test that objects shared between appended entries don't become aliases."""
+        config = ModelConfig(name="test/model")
+        metadata = {"cost_source": "litellm"}
+
+        with mock.patch.object(
+            ai_palindromikisa.logs, "BENCHMARK_LOGS_DIR", tmp_path / "logs"
+        ):
+            for prompts in (["a", "b"], ["c", "d"]):
+                log_path = append_task_results(
+                    config,
+                    self.SYSTEM_PROMPT,
+                    [{"prompt": prompt, "metadata": metadata} for prompt in prompts],
+                )
+
+        text = log_path.read_text(encoding="utf-8")
+        assert "&" not in text
+        data = cast("dict", yaml.safe_load(text))
+        assert [task["metadata"] for task in data["tasks"]] == [metadata] * 4
+
+    def test_rereads_externally_modified_log(self, tmp_path: Path):
+        """Test that edits made by other processes are picked up."""
+        config = ModelConfig(name="test/model")
+
+        with mock.patch.object(
+            ai_palindromikisa.logs, "BENCHMARK_LOGS_DIR", tmp_path / "logs"
+        ):
+            log_path = append_task_results(
+                config, self.SYSTEM_PROMPT, [{"prompt": "first"}]
+            )
+            log_path.write_text(
+                yaml.dump(
+                    {
+                        "date": "2025-01-01",
+                        "model": "models/test-model.yaml",
+                        "prompt_template": self.SYSTEM_PROMPT,
+                        "tasks": [{"prompt": "external"}],
+                    }
+                )
+            )
+            append_task_results(config, self.SYSTEM_PROMPT, [{"prompt": "second"}])
+
+        data = cast("dict", yaml.safe_load(log_path.read_text(encoding="utf-8")))
+        assert [task["prompt"] for task in data["tasks"]] == ["external", "second"]
+
+
 class TestGetExistingLogs:
     """Tests for get_existing_logs function."""
 
@@ -365,3 +530,47 @@ class TestGetExistingLogs:
 
         assert len(logs) == 1
         assert logs[0]["date"] == "2025-01-01"
+
+    def test_reuses_parsed_logs_while_unchanged(
+        self, tmp_path: Path, mock_system_prompt
+    ):
+        """Test that unchanged log files are parsed only once."""
+        config = ModelConfig(name="test/model")
+
+        logs_dir = tmp_path / "benchmark_logs"
+        logs_dir.mkdir()
+        log_content = {
+            "date": "2025-01-01",
+            "model": "models/test-model.yaml",
+            "prompt_template": mock_system_prompt,
+            "tasks": [],
+        }
+        (logs_dir / "2025-01-01-test-model.yaml").write_text(yaml.dump(log_content))
+
+        with (
+            mock.patch.object(ai_palindromikisa.logs, "BENCHMARK_LOGS_DIR", logs_dir),
+            mock.patch.object(
+                ai_palindromikisa.yaml_io,
+                "load_yaml",
+                wraps=ai_palindromikisa.yaml_io.load_yaml,
+            ) as load,
+        ):
+            first = get_existing_logs(config, mock_system_prompt)
+            second = get_existing_logs(config, mock_system_prompt)
+
+        assert load.call_count == 1
+        assert first == second == [log_content]
+
+    def test_append_leaves_returned_logs_untouched(
+        self, tmp_path: Path, mock_system_prompt
+    ):
+        """Test that appending results does not mutate previously returned logs."""
+        config = ModelConfig(name="test/model")
+
+        logs_dir = tmp_path / "benchmark_logs"
+        with mock.patch.object(ai_palindromikisa.logs, "BENCHMARK_LOGS_DIR", logs_dir):
+            append_task_results(config, mock_system_prompt, [{"prompt": "first"}])
+            logs = get_existing_logs(config, mock_system_prompt)
+            append_task_results(config, mock_system_prompt, [{"prompt": "second"}])
+
+        assert [task["prompt"] for task in logs[0]["tasks"]] == ["first"]
@@ -76,6 +76,7 @@ class TestCli:
         assert "benchmark" in result.output
         assert "stats" in result.output
         assert "tasks" in result.output
+        assert "--verbose" in result.output
 
     def test_version(self):
         """Test version output."""
@@ -115,6 +116,13 @@ class TestCli:
         assert "--build-only" in result.output
         assert "--output" in result.output
 
+    def test_export_json_help(self):
+        """Test export-json command help."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["export-json", "--help"])
+        assert result.exit_code == 0
+        assert "--compact" in result.output
+
     def test_migrate_help(self):
         """Test migrate command help."""
         runner = CliRunner()
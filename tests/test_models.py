@@ -1,18 +1,24 @@
 """Tests for model configuration handling."""
 
+import dataclasses
+import os
 from pathlib import Path
 from unittest import mock
 
 import pytest
 
 import ai_palindromikisa.models
+import ai_palindromikisa.yaml_io
 from ai_palindromikisa.models import (
     ModelConfig,
-    _options_match,
+    _canon_options,
+    _create_model_file,
     find_or_create_model_config,
     get_all_model_configs,
     get_display_name_from_path,
+    invalidate_cache,
     load_model_config_from_path,
+    options_match,
 )
 
 
@@ -119,6 +125,30 @@ class TestModelConfig:
         config = ModelConfig(name=name, options=options)
         assert config.get_base_filename() == expected
 
+    def test_is_immutable_and_computes_base_filename_once(self):
+        """Test that ModelConfig is frozen and memoizes its base filename."""
+        config = ModelConfig(name="test/model", options={"temperature": 0.3})
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.name = "other/model"  # type: ignore[misc]
+
+        with mock.patch.object(
+            ai_palindromikisa.models, "generate_option_suffix", return_value="-t03"
+        ) as mock_suffix:
+            assert config.get_base_filename() == "test-model-t03"
+            assert config.get_base_filename() == "test-model-t03"
+        mock_suffix.assert_called_once()
+
+    def test_options_are_read_only_copy(self):
+        """Test that options cannot change after the names are cached."""
+        options = {"temperature": 0.3}
+        config = ModelConfig(name="a/b", options=options)
+        options["temperature"] = 0.9
+
+        with pytest.raises(TypeError):
+            config.options["temperature"] = 0.9  # type: ignore[index]
+        assert config.options == {"temperature": 0.3}
+        assert config.get_base_filename() == "a-b-t03"
+
     def test_default_skip_value(self):
         """Test ModelConfig skip field defaults to False."""
         config = ModelConfig(name="test/model")
@@ -144,7 +174,7 @@ class TestModelConfig:
 
 
 class TestOptionsMatch:
-    """Tests for _options_match function."""
+    """Tests for options_match function."""
 
     @pytest.mark.parametrize(
         "opts1,opts2,expected",
@@ -169,7 +199,12 @@ class TestOptionsMatch:
     )
     def test_options_match(self, opts1, opts2, expected):
         """Test option dictionary matching."""
-        assert _options_match(opts1, opts2) == expected
+        assert options_match(opts1, opts2) == expected
+
+    def test_canon_options_is_hashable_and_order_independent(self):
+        """Test that canonical options can be used as dictionary keys."""
+        index = {_canon_options({"top_p": 1, "temperature": 0.3}): "a"}
+        assert index[_canon_options({"temperature": 0.3, "top_p": 1.0})] == "a"
 
 
 class TestGetAllModelConfigs:
@@ -227,6 +262,22 @@ class TestGetAllModelConfigs:
         assert configs[1].name == "test/skipped"
         assert configs[1].skip is True
 
+    def test_logs_options_only_when_present(self, mock_models_dir, caplog):
+        """Test that found models mention options only if they have some."""
+        (mock_models_dir / "a.yaml").write_text("name: test/a\n")
+        (mock_models_dir / "b-t05.yaml").write_text(
+            "name: test/b\noptions:\n  temperature: 0.5\n"
+        )
+        invalidate_cache()
+
+        with caplog.at_level("INFO", logger="ai_palindromikisa.models"):
+            get_all_model_configs()
+
+        assert caplog.messages == [
+            "Found model: test/a (from a.yaml)",
+            "Found model: test/b (options: {'temperature': 0.5}) (from b-t05.yaml)",
+        ]
+
     def test_skip_defaults_to_false_in_yaml(self, mock_models_dir):
         """Test that skip field defaults to False when not in YAML file."""
         (mock_models_dir / "test-model.yaml").write_text("name: test/model\n")
@@ -277,6 +328,47 @@ class TestGetAllModelConfigs:
             "test/d": True,
         }
 
+    def test_unchanged_directory_is_served_from_cache(self, mock_models_dir):
+        """Test that repeated calls don't reparse unchanged model files."""
+        (mock_models_dir / "test-model.yaml").write_text("name: test/model\n")
+        invalidate_cache()
+
+        first = get_all_model_configs()
+        with mock.patch.object(ai_palindromikisa.yaml_io, "load_yaml") as mock_load:
+            second = get_all_model_configs()
+
+        mock_load.assert_not_called()
+        assert second == first
+        assert second is not first
+
+    def test_changed_file_invalidates_cache(self, mock_models_dir):
+        """Test that modifying a model file causes it to be reread."""
+        model_file = mock_models_dir / "test-model.yaml"
+        model_file.write_text("name: test/model\n")
+        assert get_all_model_configs()[0].options == {}
+
+        model_file.write_text("name: test/model\noptions:\n  temperature: 0.5\n")
+
+        assert get_all_model_configs()[0].options == {"temperature": 0.5}
+
+    def test_only_changed_files_are_reparsed(self, mock_models_dir):
+        """Test that unchanged files keep their parsed contents across changes."""
+        (mock_models_dir / "a.yaml").write_text("name: test/a\n")
+        (mock_models_dir / "b.yaml").write_text("name: test/b\n")
+        invalidate_cache()
+        get_all_model_configs()
+
+        (mock_models_dir / "c.yaml").write_text("name: test/c\n")
+        with mock.patch.object(
+            ai_palindromikisa.yaml_io,
+            "load_yaml",
+            wraps=ai_palindromikisa.yaml_io.load_yaml,
+        ) as mock_load:
+            configs = get_all_model_configs()
+
+        mock_load.assert_called_once_with(mock_models_dir / "c.yaml")
+        assert [config.name for config in configs] == ["test/a", "test/b", "test/c"]
+
 
 class TestFindOrCreateModelConfig:
     """Tests for find_or_create_model_config function."""
@@ -313,6 +405,46 @@ class TestFindOrCreateModelConfig:
         # Verify file was created with option suffix
         assert (mock_models_dir / "test-model-t05.yaml").exists()
 
+    def test_creates_missing_models_directory(self, mock_models_dir):
+        """Test that the models directory is created on first write if missing."""
+        mock_models_dir.rmdir()
+
+        find_or_create_model_config("test/model", {})
+
+        assert (mock_models_dir / "test-model.yaml").exists()
+
+    def test_create_model_file_skips_identical_content(self, mock_models_dir):
+        """Test that rewriting an unchanged model file is skipped."""
+        config = ModelConfig("test/model", {"temperature": 0.5})
+        path = _create_model_file(config)
+
+        with mock.patch.object(
+            ai_palindromikisa.models, "write_bytes_atomic"
+        ) as mock_write:
+            assert _create_model_file(config) == path
+
+        mock_write.assert_not_called()
+        assert [p.name for p in mock_models_dir.iterdir()] == ["test-model-t05.yaml"]
+
+    def test_created_file_round_trips_through_loader(self, mock_models_dir):
+        """Test that a created model file loads back with the same options."""
+        find_or_create_model_config("test/model", {"temperature": 0.5, "top_p": 1})
+
+        loaded = load_model_config_from_path("models/test-model-t05-tp1.yaml")
+
+        assert loaded == ModelConfig("test/model", {"temperature": 0.5, "top_p": 1})
+
+    @pytest.mark.parametrize("value", [1e-05, 1e20, 0.3])
+    def test_created_file_keeps_float_options(self, mock_models_dir, value):
+        """Test that floats written in exponent form load back as floats."""
+        find_or_create_model_config("x/y", {"min_p": value})
+        invalidate_cache()
+
+        config = find_or_create_model_config("x/y", {"min_p": value})
+
+        (model_file,) = mock_models_dir.iterdir()
+        assert load_model_config_from_path(f"models/{model_file.name}") == config
+
     def test_creates_first_config_for_new_model_with_options(self, mock_models_dir):
         """Test creating first model config for new model with options."""
         config = find_or_create_model_config("new/model", {"temperature": 0.3})
@@ -331,6 +463,56 @@ class TestFindOrCreateModelConfig:
         # Verify file was created without suffix
         assert (mock_models_dir / "new-model.yaml").exists()
 
+    def test_created_file_is_listed_without_parsing(self, mock_models_dir):
+        """Test that a file written by this process is not parsed when listed."""
+        invalidate_cache()
+        config = find_or_create_model_config("test/model", {"temperature": 0.3})
+
+        with mock.patch.object(ai_palindromikisa.yaml_io, "load_yaml") as mock_load:
+            configs = get_all_model_configs()
+
+        mock_load.assert_not_called()
+        assert configs == [config]
+
+    def test_configs_listed_earlier_are_not_reread(self, mock_models_dir):
+        """Test that files indexed by get_all_model_configs aren't parsed again."""
+        (mock_models_dir / "test-model-t03.yaml").write_text(
+            "name: test/model\noptions:\n  temperature: 0.3\n"
+        )
+        invalidate_cache()
+        get_all_model_configs()
+
+        with mock.patch.object(ai_palindromikisa.yaml_io, "load_yaml") as mock_load:
+            config = find_or_create_model_config("test/model", {"temperature": 0.3})
+
+        mock_load.assert_not_called()
+        assert config == ModelConfig("test/model", {"temperature": 0.3})
+
+    def test_file_edited_after_listing_is_validated(self, mock_models_dir):
+        """Test that a model file changed since it was parsed is checked again."""
+        model_file = mock_models_dir / "test-model-t03.yaml"
+        model_file.write_text("name: test/model\noptions:\n  temperature: 0.3\n")
+        invalidate_cache()
+        get_all_model_configs()
+
+        model_file.write_text("name: test/model\noptions:\n  temperature: 0.5\n")
+        os.utime(model_file, ns=(0, 0))
+
+        with pytest.raises(ValueError, match="different options"):
+            find_or_create_model_config("test/model", {"temperature": 0.3})
+
+    def test_file_deleted_after_listing_is_recreated(self, mock_models_dir):
+        """Test that a model file removed since it was parsed is written again."""
+        model_file = mock_models_dir / "test-model-t03.yaml"
+        model_file.write_text("name: test/model\noptions:\n  temperature: 0.3\n")
+        invalidate_cache()
+        get_all_model_configs()
+
+        model_file.unlink()
+        find_or_create_model_config("test/model", {"temperature": 0.3})
+
+        assert model_file.exists()
+
     def test_raises_error_on_options_mismatch(self, mock_models_dir):
         """Test that ValueError is raised when file exists with different options."""
         # Create file with different options than what we'll request
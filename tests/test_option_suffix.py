@@ -26,6 +26,10 @@ class TestFormatOptionValue:
             (0.0001, "00001"),
             (10.5, "105"),
             (100.0, "100"),
+            (1e-05, "000001"),
+            (0.1 + 0.2, "03"),
+            # Large floats keep the digits of 10-decimal formatting
+            (1234567.1, "12345671000000001"),
             # Negative floats
             (-0.5, "-05"),
             (-1.0, "-1"),
@@ -88,6 +92,11 @@ class TestGenerateAbbreviations:
         assert result["top_p"] == "tp"  # First alphabetically keeps it
         assert result["top_prob"] == "tpr"  # Second expands
 
+    def test_collision_of_three_names(self):
+        """Test that each expansion avoids abbreviations taken earlier."""
+        result = _generate_abbreviations(["top_p", "top_prob", "top_probe"])
+        assert result == {"top_p": "tp", "top_prob": "tpr", "top_probe": "topr"}
+
     def test_collision_simple_names(self):
         """Test simple names that collide on first letter."""
         result = _generate_abbreviations(["temp", "test"])
@@ -174,3 +183,9 @@ class TestGenerateOptionSuffix:
         )
         # Sorted: max_tokens, stream, temperature
         assert result == "-mt100-strue-t07"
+
+    def test_equal_values_of_different_types_are_not_confused(self):
+        """Test that memoization keeps True, 1 and 1.0 apart."""
+        assert generate_option_suffix({"stream": 1}) == "-s1"
+        assert generate_option_suffix({"stream": True}) == "-strue"
+        assert generate_option_suffix({"stream": 1.0}) == "-s1"
@@ -81,6 +81,37 @@ class TestGetRequestCost:
             assert source == "unknown"
 
 
+class TestCalculateCostFromTokens:
+    """Tests for calculate_cost_from_tokens function."""
+
+    @pytest.fixture
+    def pricing_data(self):
+        """Patch the session pricing data and reset the derived rate table."""
+        data = {
+            "gpt-4o-mini": [0.001, 0.002],
+            "no-output-rate": [0.001, 0],
+        }
+        with (
+            mock.patch.object(pricing, "_pricing_data", data),
+            mock.patch.object(pricing, "_rate_table", None),
+        ):
+            yield data
+
+    def test_known_model(self, pricing_data):
+        """Multiplies token counts by the model's rates."""
+        cost = pricing.calculate_cost_from_tokens("openai/gpt-4o-mini", 100, 10)
+        assert cost == pytest.approx(0.12)
+
+    def test_missing_rate_counts_as_zero(self, pricing_data):
+        """A missing rate field contributes nothing to the cost."""
+        cost = pricing.calculate_cost_from_tokens("no-output-rate", 100, 10)
+        assert cost == pytest.approx(0.1)
+
+    def test_unknown_model(self, pricing_data):
+        """Returns None for models missing from the pricing data."""
+        assert pricing.calculate_cost_from_tokens("unknown", 100, 10) is None
+
+
 class TestNormalizeModelNameForLitellm:
     """Tests for normalize_model_name_for_litellm function."""
 
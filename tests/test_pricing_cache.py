@@ -90,7 +90,7 @@ class TestSaveAndLoadCache:
     """Tests for save_pricing_to_cache and load_pricing_from_cache functions."""
 
     def test_save_and_load_round_trip(self, tmp_path):
-        """Data saved can be loaded back correctly."""
+        """Per-token rates saved can be loaded back correctly."""
         cache_file = tmp_path / "pricing.json"
         metadata_file = tmp_path / "metadata.json"
         cache_dir = tmp_path
@@ -111,7 +111,22 @@ class TestSaveAndLoadCache:
 
             # Load
             loaded_data = pricing_cache.load_pricing_from_cache()
-            assert loaded_data == test_data
+            assert loaded_data == {"gpt-4": [0.00001, 0.00002]}
+
+    def test_load_prunes_cache_with_full_entries(self, tmp_path):
+        """A cache written before pruning is reduced to per-token rates."""
+        cache_file = tmp_path / "pricing.json"
+        cache_file.write_text(
+            json.dumps(
+                {
+                    "sample_spec": "documentation",
+                    "gpt-4": {"input_cost_per_token": 0.00001, "max_tokens": 8192},
+                }
+            )
+        )
+
+        with mock.patch.object(pricing_cache, "CACHE_FILE", cache_file):
+            assert pricing_cache.load_pricing_from_cache() == {"gpt-4": [0.00001, 0]}
 
     def test_load_nonexistent_cache(self, tmp_path):
         """Returns None when cache file doesn't exist."""
@@ -129,6 +144,28 @@ class TestSaveAndLoadCache:
             assert pricing_cache.load_pricing_from_cache() is None
 
 
+class TestPrunePricingData:
+    """Tests for prune_pricing_data function."""
+
+    def test_keeps_only_token_rates(self):
+        """Unused fields and non-model entries are dropped."""
+        pricing_data = {
+            "sample_spec": "documentation",
+            "gpt-4": {
+                "input_cost_per_token": 0.00003,
+                "output_cost_per_token": 0.00006,
+                "max_tokens": 8192,
+                "litellm_provider": "openai",
+            },
+            "embedding-only": {"input_cost_per_token": 0.0000001},
+        }
+
+        assert pricing_cache.prune_pricing_data(pricing_data) == {
+            "gpt-4": [0.00003, 0.00006],
+            "embedding-only": [0.0000001, 0],
+        }
+
+
 class TestFetchPricingFromGitHub:
     """Tests for fetch_pricing_from_github function."""
 
@@ -140,7 +177,8 @@ class TestFetchPricingFromGitHub:
 
         with mock.patch("requests.get", return_value=mock_response):
             result = pricing_cache.fetch_pricing_from_github()
-            assert result == {"gpt-4": {"input_cost_per_token": 0.00001}}
+            assert result.data == {"gpt-4": {"input_cost_per_token": 0.00001}}
+            assert result.not_modified is False
 
     def test_network_error(self):
         """Returns None on network error."""
@@ -162,6 +200,64 @@ class TestFetchPricingFromGitHub:
             result = pricing_cache.fetch_pricing_from_github()
             assert result is None
 
+    def test_stores_validators_and_sends_them_on_refresh(self, tmp_path):
+        """ETag/Last-Modified are saved and sent as conditional request headers."""
+        mock_response = mock.Mock(status_code=200)
+        mock_response.json.return_value = {"gpt-4": {"input_cost_per_token": 1e-05}}
+        mock_response.headers = {
+            "ETag": '"abc"',
+            "Last-Modified": "Mon, 01 Dec 2025 00:00:00 GMT",
+        }
+
+        with (
+            mock.patch.object(pricing_cache, "CACHE_FILE", tmp_path / "pricing.json"),
+            mock.patch.object(
+                pricing_cache, "CACHE_METADATA_FILE", tmp_path / "metadata.json"
+            ),
+            mock.patch.object(pricing_cache, "CACHE_DIR", tmp_path),
+            mock.patch("requests.get", return_value=mock_response) as mock_get,
+        ):
+            fetched = pricing_cache.fetch_pricing_from_github()
+            assert fetched.validators == {
+                "etag": '"abc"',
+                "last_modified": "Mon, 01 Dec 2025 00:00:00 GMT",
+            }
+            pricing_cache.save_pricing_to_cache(fetched.data, fetched.validators)
+            assert mock_get.call_args.kwargs["headers"] == {}
+
+            pricing_cache.fetch_pricing_from_github()
+
+        assert mock_get.call_args.kwargs["headers"] == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 01 Dec 2025 00:00:00 GMT",
+        }
+
+    def test_not_modified_returns_cache_and_refreshes_timestamp(self, tmp_path):
+        """A 304 response reuses the cached data and marks the cache fresh."""
+        cache_file = tmp_path / "pricing.json"
+        metadata_file = tmp_path / "metadata.json"
+        cached_data = {"cached": [0.001, 0.002]}
+        cache_file.write_text(json.dumps(cached_data))
+        old_timestamp = time.time() - (25 * 3600)
+        metadata_file.write_text(
+            json.dumps({"fetch_timestamp": old_timestamp, "etag": '"abc"'})
+        )
+
+        with (
+            mock.patch.object(pricing_cache, "CACHE_FILE", cache_file),
+            mock.patch.object(pricing_cache, "CACHE_METADATA_FILE", metadata_file),
+            mock.patch.object(pricing_cache, "CACHE_DIR", tmp_path),
+            mock.patch("requests.get", return_value=mock.Mock(status_code=304)),
+        ):
+            result = pricing_cache.get_pricing_data()
+            assert result == cached_data
+            assert pricing_cache.is_cache_fresh() is True
+
+        metadata = json.loads(metadata_file.read_text())
+        assert metadata["etag"] == '"abc"'
+        # The unchanged data is not written again
+        assert cache_file.read_text() == json.dumps(cached_data)
+
 
 class TestGetPricingData:
     """Tests for get_pricing_data function."""
@@ -171,7 +267,7 @@ class TestGetPricingData:
         cache_file = tmp_path / "pricing.json"
         metadata_file = tmp_path / "metadata.json"
 
-        cached_data = {"model": {"input_cost_per_token": 0.001}}
+        cached_data = {"model": [0.001, 0.002]}
         cache_file.write_text(json.dumps(cached_data))
         metadata_file.write_text(json.dumps({"fetch_timestamp": time.time()}))
 
@@ -186,6 +282,31 @@ class TestGetPricingData:
             assert result == cached_data
             mock_fetch.assert_not_called()
 
+    def test_reads_metadata_once(self, tmp_path):
+        """The metadata file is parsed only once per call."""
+        cache_file = tmp_path / "pricing.json"
+        metadata_file = tmp_path / "metadata.json"
+        cache_file.write_text(json.dumps({"stale": [0.001, 0.002]}))
+        old_timestamp = time.time() - (25 * 3600)
+        metadata_file.write_text(json.dumps({"fetch_timestamp": old_timestamp}))
+
+        with (
+            mock.patch.object(pricing_cache, "CACHE_FILE", cache_file),
+            mock.patch.object(pricing_cache, "CACHE_METADATA_FILE", metadata_file),
+            mock.patch(
+                "ai_palindromikisa.pricing_cache.fetch_pricing_from_github",
+                return_value=None,
+            ),
+            mock.patch.object(
+                pricing_cache,
+                "_read_cache_metadata",
+                wraps=pricing_cache._read_cache_metadata,
+            ) as mock_read,
+        ):
+            assert pricing_cache.get_pricing_data() == {"stale": [0.001, 0.002]}
+
+        mock_read.assert_called_once()
+
     def test_fetches_when_cache_stale(self, tmp_path):
         """Fetches from GitHub when cache is stale."""
         cache_file = tmp_path / "pricing.json"
@@ -193,7 +314,7 @@ class TestGetPricingData:
         cache_dir = tmp_path
 
         # Old cache
-        old_data = {"old": {"input_cost_per_token": 0.001}}
+        old_data = {"old": [0.001, 0.002]}
         cache_file.write_text(json.dumps(old_data))
         old_timestamp = time.time() - (25 * 3600)  # 25 hours ago
         metadata_file.write_text(json.dumps({"fetch_timestamp": old_timestamp}))
@@ -206,11 +327,11 @@ class TestGetPricingData:
             mock.patch.object(pricing_cache, "CACHE_DIR", cache_dir),
             mock.patch(
                 "ai_palindromikisa.pricing_cache.fetch_pricing_from_github",
-                return_value=new_data,
+                return_value=pricing_cache.PricingFetch(new_data),
             ),
         ):
             result = pricing_cache.get_pricing_data()
-            assert result == new_data
+            assert result == {"new": [0.002, 0]}
 
     def test_force_refresh(self, tmp_path):
         """Force refresh fetches from GitHub even with fresh cache."""
@@ -218,7 +339,7 @@ class TestGetPricingData:
         metadata_file = tmp_path / "metadata.json"
         cache_dir = tmp_path
 
-        cached_data = {"cached": {"input_cost_per_token": 0.001}}
+        cached_data = {"cached": [0.001, 0.002]}
         cache_file.write_text(json.dumps(cached_data))
         metadata_file.write_text(json.dumps({"fetch_timestamp": time.time()}))
 
@@ -230,18 +351,18 @@ class TestGetPricingData:
             mock.patch.object(pricing_cache, "CACHE_DIR", cache_dir),
             mock.patch(
                 "ai_palindromikisa.pricing_cache.fetch_pricing_from_github",
-                return_value=new_data,
+                return_value=pricing_cache.PricingFetch(new_data),
             ),
         ):
             result = pricing_cache.get_pricing_data(force_refresh=True)
-            assert result == new_data
+            assert result == {"fresh": [0.002, 0]}
 
     def test_falls_back_to_stale_cache_on_fetch_failure(self, tmp_path):
         """Uses stale cache when GitHub fetch fails."""
         cache_file = tmp_path / "pricing.json"
         metadata_file = tmp_path / "metadata.json"
 
-        stale_data = {"stale": {"input_cost_per_token": 0.001}}
+        stale_data = {"stale": [0.001, 0.002]}
         cache_file.write_text(json.dumps(stale_data))
         old_timestamp = time.time() - (25 * 3600)
         metadata_file.write_text(json.dumps({"fetch_timestamp": old_timestamp}))
@@ -273,3 +394,37 @@ class TestGetPricingData:
         ):
             result = pricing_cache.get_pricing_data()
             assert result == {}
+
+
+class TestUpdatePricingCache:
+    """Tests for update_pricing_cache function."""
+
+    def test_saves_download_with_validators(self):
+        """A downloaded file is saved along with its HTTP validators."""
+        fetched = pricing_cache.PricingFetch({"gpt-4": {}}, {"etag": '"abc"'})
+
+        with (
+            mock.patch.object(
+                pricing_cache, "fetch_pricing_from_github", return_value=fetched
+            ),
+            mock.patch.object(
+                pricing_cache, "save_pricing_to_cache", return_value=True
+            ) as mock_save,
+        ):
+            assert pricing_cache.update_pricing_cache() is True
+
+        mock_save.assert_called_once_with({"gpt-4": {}}, {"etag": '"abc"'})
+
+    def test_not_modified_skips_save(self):
+        """A 304 response leaves the cached pricing data as is."""
+        fetched = pricing_cache.PricingFetch({"gpt-4": [0.1, 0.2]}, not_modified=True)
+
+        with (
+            mock.patch.object(
+                pricing_cache, "fetch_pricing_from_github", return_value=fetched
+            ),
+            mock.patch.object(pricing_cache, "save_pricing_to_cache") as mock_save,
+        ):
+            assert pricing_cache.update_pricing_cache() is True
+
+        mock_save.assert_not_called()
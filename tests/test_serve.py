@@ -0,0 +1,122 @@
+"""Tests for the site build used by the serve command."""
+
+import json
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from ai_palindromikisa import serve
+
+
+@pytest.fixture
+def exported():
+    """Patch export_json and reset the remembered data.json digests."""
+    data = {"models": [{"name": "äiti", "accuracy": 0.5}], "tasks": []}
+    with (
+        mock.patch.object(serve, "export_json", return_value=data),
+        mock.patch.object(serve, "_last_data_hash", {}),
+    ):
+        yield data
+
+
+class TestWriteData:
+    """Tests for _write_data function."""
+
+    def test_writes_compact_utf8_json(self, tmp_path: Path, exported):
+        """Test that data.json holds the export as compact UTF-8 JSON."""
+        serve._write_data(tmp_path)
+
+        content = (tmp_path / "data.json").read_bytes()
+        assert json.loads(content) == exported
+        assert "äiti".encode() in content
+        assert b", " not in content
+        assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+    def test_unchanged_data_is_not_rewritten(self, tmp_path: Path, exported):
+        """Test that identical exports leave the existing file untouched."""
+        serve._write_data(tmp_path)
+        data_path = tmp_path / "data.json"
+        os.utime(data_path, ns=(0, 0))
+
+        serve._write_data(tmp_path)
+
+        assert data_path.stat().st_mtime_ns == 0
+        assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+    def test_new_timestamp_alone_is_not_rewritten(self, tmp_path: Path):
+        """Test that re-exporting the same benchmark logs keeps data.json as is."""
+        data_path = tmp_path / "data.json"
+        with mock.patch.object(serve, "_last_data_hash", {}):
+            serve._write_data(tmp_path)
+            os.utime(data_path, ns=(0, 0))
+
+            serve._write_data(tmp_path)
+
+        assert data_path.stat().st_mtime_ns == 0
+        assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+    def test_changed_data_is_rewritten(self, tmp_path: Path, exported):
+        """Test that a different export replaces data.json."""
+        serve._write_data(tmp_path)
+        exported["tasks"].append({"prompt": "a"})
+
+        serve._write_data(tmp_path)
+
+        assert json.loads((tmp_path / "data.json").read_bytes()) == exported
+
+    def test_failed_write_removes_temporary_file(self, tmp_path: Path, exported):
+        """Test that an error while writing leaves no temporary file behind."""
+        with (
+            mock.patch.object(Path, "replace", side_effect=OSError("disk full")),
+            pytest.raises(OSError, match="disk full"),
+        ):
+            serve._write_data(tmp_path)
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestLinkOrCopy:
+    """Tests for _link_or_copy function."""
+
+    def test_links_new_file(self, tmp_path: Path):
+        """Test that a missing destination becomes a hardlink to the source."""
+        src = tmp_path / "app.js"
+        src.write_text("a")
+        dst = tmp_path / "out.js"
+
+        serve._link_or_copy(src, dst)
+
+        assert os.path.samefile(src, dst)
+
+    def test_relinks_replaced_source(self, tmp_path: Path):
+        """Test that a source replaced by a newer file is linked again."""
+        src = tmp_path / "app.js"
+        src.write_text("old")
+        dst = tmp_path / "out.js"
+        serve._link_or_copy(src, dst)
+        os.utime(dst, ns=(0, 0))
+
+        replacement = tmp_path / "app.js.new"
+        replacement.write_text("new")
+        replacement.replace(src)
+        serve._link_or_copy(src, dst)
+
+        assert dst.read_text() == "new"
+        assert os.path.samefile(src, dst)
+
+    def test_copies_when_linking_fails(self, tmp_path: Path):
+        """Test the copy fallback and that an up-to-date copy is kept."""
+        src = tmp_path / "app.js"
+        src.write_text("a")
+        dst = tmp_path / "out.js"
+
+        with mock.patch.object(serve.os, "link", side_effect=OSError):
+            serve._link_or_copy(src, dst)
+            assert dst.read_text() == "a"
+            assert not os.path.samefile(src, dst)
+
+            with mock.patch.object(serve.shutil, "copyfile") as mock_copy:
+                serve._link_or_copy(src, dst)
+            mock_copy.assert_not_called()
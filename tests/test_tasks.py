@@ -0,0 +1,48 @@
+"""Tests for benchmark task loading."""
+
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from ai_palindromikisa import tasks, yaml_io
+
+
+@pytest.fixture
+def tasks_file(tmp_path: Path):
+    """Point load_tasks at a temporary tasks file with an empty cache."""
+    path = tmp_path / "basic_tasks.yaml"
+    path.write_text("system_prompt: Solve {prompt}\ntasks:\n  - prompt: a\n")
+    with (
+        mock.patch.object(tasks, "BASIC_TASKS_FILE", path),
+        mock.patch.object(yaml_io, "_yaml_cache", {}),
+    ):
+        yield path
+
+
+class TestLoadTasks:
+    """Tests for load_tasks function."""
+
+    def test_loads_prompt_and_tasks(self, tasks_file):
+        """Test that the system prompt and task list are returned."""
+        assert tasks.load_tasks() == ("Solve {prompt}", [{"prompt": "a"}])
+
+    def test_reuses_parsed_tasks(self, tasks_file):
+        """Test that an unchanged file is parsed only once."""
+        with mock.patch.object(
+            yaml_io, "load_yaml", wraps=yaml_io.load_yaml
+        ) as mock_load:
+            first = tasks.load_tasks()
+            second = tasks.load_tasks()
+
+        assert second[1] is first[1]
+        mock_load.assert_called_once()
+
+    def test_rereads_changed_file(self, tasks_file):
+        """Test that edits to the tasks file are picked up."""
+        tasks.load_tasks()
+        tasks_file.write_text("system_prompt: New\ntasks: []\n")
+        os.utime(tasks_file, ns=(0, 0))
+
+        assert tasks.load_tasks() == ("New", [])
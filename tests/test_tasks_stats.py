@@ -0,0 +1,58 @@
+"""Tests for task statistics aggregation."""
+
+import os
+from pathlib import Path
+from unittest import mock
+
+from ai_palindromikisa import tasks_stats
+
+
+class TestBuildSuccessMap:
+    """Tests for _build_success_map function."""
+
+    def test_marks_only_correct_results(self):
+        """Test that correct models show their marker and others a space."""
+        task_data = tasks_stats.TaskStats(
+            model_results={
+                "a": tasks_stats.ModelResult(correct=True, time=1.0, cost=0.0),
+                "b": tasks_stats.ModelResult(correct=False, time=1.0, cost=0.0),
+                "d": tasks_stats.ModelResult(correct=True, time=1.0, cost=0.0),
+            }
+        )
+        styles = tasks_stats._build_model_styles(
+            ["a", "b", "c", "d"],
+            {"a": "1", "b": "2", "c": "3", "d": "4"},
+            {"a": "red", "b": "red", "c": "red", "d": "blue"},
+        )
+
+        success_map = tasks_stats._build_success_map(
+            task_data, ["a", "b", "c", "d"], styles
+        )
+
+        assert success_map == "[red]1[/red]  [blue]4[/blue]"
+
+
+class TestListLogs:
+    """Tests for _list_logs function."""
+
+    def test_rescans_only_when_directory_changes(self, tmp_path: Path):
+        """Test that the listing is reused until a log is added."""
+        (tmp_path / "b.yaml").write_text("tasks: []\n")
+        (tmp_path / "a.yaml").write_text("tasks: []\n")
+        (tmp_path / "notes.txt").write_text("")
+        os.utime(tmp_path, ns=(0, 0))
+
+        with (
+            mock.patch.object(tasks_stats, "BENCHMARK_LOGS_DIR", tmp_path),
+            mock.patch.object(tasks_stats, "_log_list_cache", None),
+        ):
+            assert tasks_stats._list_logs() == [
+                tmp_path / "a.yaml",
+                tmp_path / "b.yaml",
+            ]
+            with mock.patch.object(Path, "glob") as mock_glob:
+                tasks_stats._list_logs()
+            mock_glob.assert_not_called()
+
+            (tmp_path / "c.yaml").write_text("tasks: []\n")
+            assert tasks_stats._list_logs()[-1] == tmp_path / "c.yaml"
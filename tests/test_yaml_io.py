@@ -0,0 +1,239 @@
+"""Tests for shared YAML helpers."""
+
+import os
+import shutil
+from pathlib import Path
+from unittest import mock
+
+import pytest
+import yaml
+
+from ai_palindromikisa import yaml_io
+from ai_palindromikisa.paths import BENCHMARK_LOGS_DIR
+from ai_palindromikisa.yaml_io import (
+    SafeLoader,
+    dump_log_yaml,
+    dump_yaml_round_trip,
+    forget_yaml,
+    load_yaml,
+    load_yaml_cached,
+    load_yaml_files_cached,
+    load_yaml_round_trip,
+    remember_yaml,
+    write_bytes_atomic,
+)
+
+
+@pytest.fixture
+def log_file(tmp_path: Path):
+    """Create a YAML file and start with an empty parse cache."""
+    path = tmp_path / "2025-12-01-model.yaml"
+    path.write_text("model: models/model.yaml\ntasks: []\n")
+    with mock.patch.object(yaml_io, "_yaml_cache", {}):
+        yield path
+
+
+class TestLoadYaml:
+    """Tests for load_yaml function."""
+
+    def test_loads_utf8_file(self, tmp_path: Path):
+        """Test that non-ASCII content is decoded correctly."""
+        path = tmp_path / "data.yaml"
+        path.write_text("prompt: Täydennä loppuosa\n", encoding="utf-8")
+
+        assert load_yaml(path) == {"prompt": "Täydennä loppuosa"}
+
+    def test_loads_json_document(self, tmp_path: Path):
+        """Test that JSON content (as in generated model files) is accepted."""
+        path = tmp_path / "model.yaml"
+        path.write_text('{"name": "test/model", "options": {"temperature": 0.3}}')
+
+        assert load_yaml(path) == {
+            "name": "test/model",
+            "options": {"temperature": 0.3},
+        }
+
+    @pytest.mark.skipif(
+        not yaml.__with_libyaml__, reason="PyYAML built without LibYAML"
+    )
+    def test_uses_libyaml_loader(self):
+        """Test that the C loader is picked when PyYAML provides it."""
+        assert SafeLoader is yaml.CSafeLoader
+
+
+class TestLoadYamlCached:
+    """Tests for load_yaml_cached and related cache functions."""
+
+    def test_unchanged_file_is_parsed_once(self, log_file):
+        """Test that a second load of an unchanged file uses the cache."""
+        with mock.patch.object(
+            yaml_io, "load_yaml", wraps=yaml_io.load_yaml
+        ) as mock_load:
+            first = load_yaml_cached(log_file)
+            second = load_yaml_cached(log_file)
+
+        assert first == {"model": "models/model.yaml", "tasks": []}
+        assert second is first
+        mock_load.assert_called_once()
+
+    def test_changed_file_is_reparsed(self, log_file):
+        """Test that edits to a file are picked up."""
+        load_yaml_cached(log_file)
+        log_file.write_text("model: models/other.yaml\ntasks: []\n")
+        os.utime(log_file, ns=(0, 0))
+
+        assert load_yaml_cached(log_file)["model"] == "models/other.yaml"
+
+    def test_remembered_document_is_not_parsed(self, log_file):
+        """Test that a document cached after writing it is returned as is."""
+        data = {"model": "models/model.yaml", "tasks": []}
+        remember_yaml(log_file, data)
+
+        with mock.patch.object(yaml_io, "load_yaml") as mock_load:
+            assert load_yaml_cached(log_file) is data
+        mock_load.assert_not_called()
+
+    def test_files_keep_order_and_return_errors(self, log_file, tmp_path: Path):
+        """Test that several files load in order with errors returned in place."""
+        missing = tmp_path / "missing.yaml"
+
+        result = load_yaml_files_cached([missing, log_file])
+
+        assert isinstance(result[0], FileNotFoundError)
+        assert result[1] == {"model": "models/model.yaml", "tasks": []}
+
+    def test_forget_keeps_listed_files(self, log_file, tmp_path: Path):
+        """Test that forgetting a directory spares the files to keep."""
+        other = tmp_path / "other.yaml"
+        other.write_text("a: 1\n")
+        load_yaml_files_cached([log_file, other])
+
+        forget_yaml(tmp_path, keep={other})
+
+        assert set(yaml_io._yaml_cache) == {other}
+
+
+class TestDumpLogYaml:
+    """Tests for dump_log_yaml function."""
+
+    def test_indents_sequences_under_parent_key(self):
+        """Test that list items are indented below their key."""
+        output = dump_log_yaml({"tasks": [{"prompt": "a", "answer": "b"}]})
+
+        assert output == "tasks:\n  - prompt: a\n    answer: b\n"
+
+    def test_multiline_strings_use_literal_block(self):
+        """Test that multi-line strings are written as literal blocks."""
+        output = dump_log_yaml({"prompt_template": "line 1\nline 2"})
+
+        assert output == "prompt_template: |-\n  line 1\n  line 2\n"
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (1.2e-05, "0.000012"),
+            (0.02620838, "0.02620838"),
+            (3.0, "3.0"),
+            (float("inf"), ".inf"),
+        ],
+    )
+    def test_floats_avoid_scientific_notation(self, value, expected):
+        """Test float formatting."""
+        assert dump_log_yaml({"cost_usd": value}) == f"cost_usd: {expected}\n"
+
+    def test_preserves_key_order_and_unicode(self):
+        """Test that keys keep insertion order and non-ASCII is not escaped."""
+        data = {"date": "2025-11-28", "answer": "äiti", "is_correct": True}
+
+        output = dump_log_yaml(data)
+
+        assert output == "date: '2025-11-28'\nanswer: äiti\nis_correct: true\n"
+        assert yaml.safe_load(output) == data
+
+
+class TestWriteBytesAtomic:
+    """Tests for write_bytes_atomic function."""
+
+    def test_creates_missing_parent_directory(self, tmp_path: Path):
+        """Test that the file is written into a directory created on demand."""
+        path = tmp_path / "new" / "file.yaml"
+
+        write_bytes_atomic(path, b"name: test\n")
+
+        assert path.read_bytes() == b"name: test\n"
+        assert [p.name for p in path.parent.iterdir()] == ["file.yaml"]
+
+    def test_failed_rename_keeps_old_file_and_removes_temporary(self, tmp_path: Path):
+        """Test that a failing write leaves no temporary file behind."""
+        path = tmp_path / "file.yaml"
+        path.write_bytes(b"old\n")
+
+        with (
+            mock.patch.object(Path, "replace", side_effect=OSError("disk full")),
+            pytest.raises(OSError),
+        ):
+            write_bytes_atomic(path, b"new\n")
+
+        assert path.read_bytes() == b"old\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["file.yaml"]
+
+    def test_interrupted_write_removes_temporary(self, tmp_path: Path):
+        """Test that an interrupt during the write cleans up the temporary file."""
+        path = tmp_path / "file.yaml"
+
+        with (
+            mock.patch.object(Path, "write_bytes", side_effect=KeyboardInterrupt),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            write_bytes_atomic(path, b"new\n")
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestYamlRoundTrip:
+    """Tests for load_yaml_round_trip and dump_yaml_round_trip functions."""
+
+    @pytest.mark.parametrize(
+        "log_name",
+        [
+            # Indentless task list with a folded prompt
+            "2025-11-25-gpt-4o-mini.yaml",
+            # Task list indented under its key
+            "2025-11-27-gemini-gemini-2.0-flash.yaml",
+        ],
+    )
+    def test_committed_log_is_rewritten_unchanged(self, tmp_path: Path, log_name):
+        """Test that rewriting a committed log reproduces it byte for byte."""
+        path = tmp_path / log_name
+        shutil.copy(BENCHMARK_LOGS_DIR / log_name, path)
+
+        yaml_obj, data = load_yaml_round_trip(path)
+        dump_yaml_round_trip(yaml_obj, path, data)
+
+        assert path.read_bytes() == (BENCHMARK_LOGS_DIR / log_name).read_bytes()
+
+    def test_only_modified_part_changes(self, tmp_path: Path):
+        """Test that editing one value leaves the rest of the layout intact."""
+        path = tmp_path / "log.yaml"
+        path.write_text(
+            "model: models/old.yaml\n"
+            "tasks:\n"
+            "  - prompt: >-\n"
+            "      Pitkä\n"
+            "      kehote\n"
+            "    answer: 'x'\n",
+            encoding="utf-8",
+        )
+
+        yaml_obj, data = load_yaml_round_trip(path)
+        data["model"] = "models/new.yaml"
+        dump_yaml_round_trip(yaml_obj, path, data)
+
+        assert path.read_text(encoding="utf-8") == (
+            "model: models/new.yaml\n"
+            "tasks:\n"
+            "  - prompt: >-\n"
+            "      Pitkä\n"
+            "      kehote\n"
+            "    answer: 'x'\n"
+        )